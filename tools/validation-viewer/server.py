@@ -6,22 +6,55 @@ Serves validation reports from chapter directories with a web UI
 
 import os
 import sys
+import atexit
+import threading
+import time
 import json
+import mmap
 import re
-import shutil
+import struct
 import subprocess
 import tempfile
 import traceback
 import copy
+import io
+import posixpath
+from collections import defaultdict
+from dataclasses import dataclass
+import gzip
+import hashlib
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime, timedelta
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import parse_qs, urlparse
-from xml.etree import ElementTree as ET
-from zipfile import ZipFile
-import openpyxl
-from openpyxl.utils import get_column_letter
-import xlwings as xw
+from zipfile import ZIP_DEFLATED, ZipFile
+
+try:
+    import orjson
+except ImportError:  # Fall back to ujson, then the stdlib encoder/decoder
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # Only consulted when orjson is missing
+    ujson = None
+
+try:
+    import ijson
+except ImportError:  # Fall back to loading the whole hydrate file
+    ijson = None
+
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:  # Fall back to the stdlib ElementTree
+    from xml.etree import ElementTree as ET
+    LXML_AVAILABLE = False
 
 # Get AppData directory for reviewed status
 APPDATA_DIR = Path(os.getenv('APPDATA')) / 'AMS' / 'validation-viewer'
@@ -29,15 +62,84 @@ APPDATA_DIR.mkdir(parents=True, exist_ok=True)
 REVIEWED_STATUS_FILE = APPDATA_DIR / 'reviewed-status.json'
 IGNORED_ERRORS_FILE = APPDATA_DIR / 'ignored-errors.json'
 
+# Hydrate summary metrics keyed by path -> (mtime_ns, size, ignored patterns, metrics)
+HYDRATE_METRICS_CACHE = {}
+# Per-path locks so concurrent requests missing the same chapter extract its metrics once
+HYDRATE_METRICS_LOCKS = {}
+# Text report summary metrics keyed by path -> (mtime_ns, size, metrics)
+REPORT_METRICS_CACHE = {}
+# Encoded /api/report payloads keyed by hydrate path -> (mtime_ns, size, ignored patterns, payload),
+# least recently used first
+REPORT_PAYLOAD_CACHE = {}
+# Chapter directory path -> (directory mtime_ns, hydrate path or None)
+CHAPTER_SCAN_CACHE = {}
+# Book directory path -> (mtime_ns, expiry, [(chapter name, hydrate path)]); reused for CHAPTER_LIST_TTL
+CHAPTER_LIST_CACHE = {}
+# Gzipped static text files keyed by path -> (mtime_ns, size, compressed bytes)
+STATIC_GZIP_CACHE = {}
+# Parsed WAV header layouts keyed by path: (mtime_ns, size, layout or None)
+WAV_LAYOUT_CACHE = {}
+# ffmpeg-cut audio segments keyed by (path, mtime_ns, size, start, duration) -> temp WAV path,
+# least recently used first; guarded by AUDIO_SEGMENT_LOCK
+AUDIO_SEGMENT_CACHE = {}
+AUDIO_SEGMENT_LOCK = threading.Lock()
+# Per-segment locks so concurrent Range requests for the same segment run ffmpeg once
+AUDIO_SEGMENT_LOCKS = {}
+# CRX folder path -> highest numbered audio file seen there; guarded by CRX_ENTRY_LOCK
+CRX_ERROR_NUMBER_CACHE = {}
+# Open CRX workbooks keyed by path -> {'parts', 'sheet', ..., 'mtime_ns', 'dirty', 'timer'}; guarded by CRX_WORKBOOK_LOCK
+CRX_WORKBOOK_CACHE = {}
+CRX_WORKBOOK_LOCK = threading.Lock()
+# Parsed BASE_CRX template keyed by (path, mtime_ns, size); guarded by CRX_WORKBOOK_LOCK
+CRX_TEMPLATE_CACHE = {}
+# (prefix, uri) pairs already registered with ElementTree; guarded by CRX_WORKBOOK_LOCK
+REGISTERED_NAMESPACES = set()
+# Requests are served on separate threads: CRX additions allocate error numbers and write
+# files as one unit, and settings files are read/modified/written under one lock
+CRX_ENTRY_LOCK = threading.Lock()
+# CRX workbook paths already created from the template (skips the exists() probes)
+CRX_INITIALIZED = set()
+SETTINGS_LOCK = threading.RLock()
+# Reviewed chapters of the current book, reloaded when the file's mtime changes and written
+# after SETTINGS_FLUSH_DELAY of inactivity; guarded by SETTINGS_LOCK
+REVIEWED_STATUS_STATE = {'chapters': None, 'mtime_ns': None, 'dirty': False, 'timer': None}
+# Ignored patterns for the current book as a shared frozenset, re-read only when the file changes
+IGNORED_ERRORS_STATE = {'patterns': None, 'mtime_ns': None}
+REPORT_PAYLOAD_LOCK = threading.Lock()
+# Serializes BASE_DIR scans so concurrent cold requests share one listing
+CHAPTER_LIST_LOCK = threading.Lock()
+
 # Default configuration
 BASE_DIR = Path(r"C:\Aethon\InProgress\Vain Glory 2")
 PORT = 8081
+METRICS_WORKERS = 8  # Upper bound on parallel hydrate metric extraction
+CHAPTER_LIST_TTL = 2.0  # Seconds a BASE_DIR scan is reused (the sidebar and overview load back to back)
+REPORT_CACHE_SIZE = 32  # Chapters whose encoded report payload is kept in memory
+AUDIO_SEGMENT_CACHE_SIZE = 16  # ffmpeg-cut segments kept on disk for repeated Range requests
+KEEP_ALIVE_TIMEOUT = 60  # Seconds an idle keep-alive connection may hold its thread
+JSON_MMAP_MIN_SIZE = 1024 * 1024  # JSON files at least this large are parsed from a memory map
+AUDIO_STREAM_CHUNK_SIZE = 64 * 1024  # Bytes per write when streaming audio responses
+JSON_STREAM_MIN_ITEMS = 200  # Chapter lists and report sentence arrays at least this long are sent incrementally
+JSON_STREAM_CHUNK_SIZE = 64 * 1024  # Encoded bytes gathered per chunk when streaming JSON
+REPORT_READ_BUFFER_SIZE = 64 * 1024  # Read buffer when scanning text reports line by line
+HYDRATE_SCAN_CHUNK_SIZE = 64 * 1024  # Bytes per read when searching or parsing a hydrate file's tail
+# WAV format tags that can be cut on frame boundaries without decoding (PCM, IEEE float, extensible)
+WAV_SLICEABLE_FORMATS = {0x0001, 0x0003, 0xFFFE}
 
 SCRIPT_DIR = Path(__file__).resolve().parent
+STATIC_DIR = SCRIPT_DIR / 'static'
+# The index page is encoded once at startup instead of on every request
+INDEX_HTML_BYTES = (STATIC_DIR / 'index.html').read_bytes()
+INDEX_HTML_GZIP = gzip.compress(INDEX_HTML_BYTES, compresslevel=9)
+INDEX_HTML_ETAG = f'"{hashlib.blake2b(INDEX_HTML_BYTES, digest_size=8).hexdigest()}"'
+INDEX_HTML_GZIP_ETAG = INDEX_HTML_ETAG[:-1] + '-gz"'  # Each encoding gets its own tag
 REPO_ROOT = SCRIPT_DIR.parent.parent
 CRX_TEMPLATE_PATH = Path(r"C:\Aethon\BASE_CRX.xlsx")
 CRX_DIR_NAME = 'CRX'
 CRX_DATA_ROW_START = 11
+CRX_FLUSH_DELAY = 2.0  # Seconds of inactivity before pending CRX edits are saved
+CRX_ZIP_COMPRESSLEVEL = 1  # Every part is re-deflated on each save; fastest level (Excel reads any)
+SETTINGS_FLUSH_DELAY = 0.5  # Seconds of inactivity before reviewed-status changes are saved
 DEFAULT_ERROR_TYPE = 'MR'
 
 EXCEL_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
@@ -50,76 +152,780 @@ XR2_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2015/revision2'
 XR3_NS = 'http://schemas.microsoft.com/office/spreadsheetml/2016/revision3'
 
 NAMESPACES = {'a': EXCEL_NS}
-CELL_REF_RE = re.compile(r'([A-Z]+)(\d+)')
+# Qualified sheet element/attribute names, built once rather than per element
+ROW_TAG = f'{{{EXCEL_NS}}}row'
+C_TAG = f'{{{EXCEL_NS}}}c'
+V_TAG = f'{{{EXCEL_NS}}}v'
+IS_TAG = f'{{{EXCEL_NS}}}is'
+T_TAG = f'{{{EXCEL_NS}}}t'
+SI_TAG = f'{{{EXCEL_NS}}}si'
+SHARED_STRINGS_PART = 'xl/sharedStrings.xml'
+SHEET_DATA_TAG = f'{{{EXCEL_NS}}}sheetData'
+DIMENSION_TAG = f'{{{EXCEL_NS}}}dimension'
+REL_ID_ATTR = f'{{{REL_NS}}}id'
+XML_SPACE_ATTR = f'{{{XML_NS}}}space'
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\r\n'
+CELL_RANGE_RE = re.compile(r'([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?')
+
+# Validation report text patterns
+# Either header summary line; the named outer group tells which one matched
+REPORT_SUMMARY_RE = re.compile(
+    r'(?P<sentences>Sentences\s*:\s*(\d+)\s*\(Avg WER ([\d.]+)%.*Flagged (\d+)\))'
+    r'|(?P<paragraphs>Paragraphs\s*:\s*(\d+)\s*\(Avg WER ([\d.]+)%)'
+)
+REPORT_PARAGRAPH_SECTION = 'All paragraphs by WER:'
+# Section marker line -> report_data key of the items that follow
+REPORT_SECTIONS = {
+    'All sentences by WER:': 'sentences',
+    REPORT_PARAGRAPH_SECTION: 'paragraphs',
+}
+REPORT_FLAGGED_PARAGRAPH_RE = re.compile(r'#\d+ \| WER [\d.]+% \| Coverage [\d.]+% \| Status (attention|unreliable)')
+# Percentages are captured with their '%' so values can be stored without re-concatenating
+REPORT_SENTENCE_STATS_RE = re.compile(r'(\d+)\s*\(Avg WER ([\d.]+%), Max WER ([\d.]+%), Flagged (\d+)\)')
+REPORT_PARAGRAPH_STATS_RE = re.compile(r'(\d+)\s*\(Avg WER ([\d.]+%), Avg Coverage ([\d.]+%)\)')
+# Sentence ("CER") and paragraph ("Coverage") item headers share one pattern
+REPORT_ITEM_HEADER_RE = re.compile(r'#(\d+)\s*\|\s*WER\s*([\d.]+%)\s*\|\s*(CER|Coverage)\s*([\d.]+%)\s*\|\s*Status\s*(\w+)')
+TIMING_RE = re.compile(r'([\d.]+)s\s*→\s*([\d.]+)s')
+# "120-135" or a single "120"; the end group is optional so one search covers both
+INDEX_RANGE_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+NUMBER_RE = re.compile(r'\d+')
+INTEGER_RE = re.compile(r'-?\d+')
+BYTE_RANGE_RE = re.compile(r'bytes=(\d*)-(\d*)')
+
+# Shared read-only default for missing nested objects
+EMPTY_DICT = {}
+
+
+def json_default(obj):
+    """Encode slotted dataclasses (WordOp) as objects for the non-orjson encoders"""
+    slots = getattr(type(obj), '__slots__', None)
+    if slots is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return {name: getattr(obj, name) for name in slots}
+
+
+# Without orjson, match its output: compact separators and raw UTF-8 instead of \u escapes
+# (ujson is compact by default)
+JSON_FALLBACK_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=json_default)
+
+
+def dumps_json(data):
+    """Serialize data to UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    if ujson is not None:
+        return ujson.dumps(data, ensure_ascii=False, escape_forward_slashes=False, default=json_default).encode()
+    return JSON_FALLBACK_ENCODER.encode(data).encode()
+
+
+def loads_json(raw):
+    """Parse UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    if ujson is not None:
+        return ujson.loads(raw)
+    return json.loads(raw)
+
+
+def load_json_file(path):
+    """Parse a UTF-8 JSON file"""
+    with open(path, 'rb') as f:
+        # orjson parses a buffer in place, so large files (hydrate) are mapped instead of
+        # copied into a bytes object first; mmap cannot map empty files
+        if orjson is not None and os.fstat(f.fileno()).st_size >= JSON_MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+        return loads_json(f.read())
+
+
+def read_wav_layout(path):
+    """Return (fmt_chunk, data_offset, data_size, block_align, sample_rate) for an uncompressed WAV file, else None"""
+    with open(path, 'rb') as f:
+        riff = f.read(12)
+        if len(riff) < 12 or riff[:4] != b'RIFF' or riff[8:12] != b'WAVE':
+            return None
+
+        fmt_chunk = None
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                return None
+            chunk_id = chunk_header[:4]
+            chunk_size = int.from_bytes(chunk_header[4:], 'little')
+            if chunk_id == b'data':
+                break
+            if chunk_id == b'fmt ':
+                fmt_chunk = f.read(chunk_size)
+                f.seek(chunk_size & 1, os.SEEK_CUR)
+            else:
+                # Chunks are word aligned
+                f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+        data_offset = f.tell()
+        file_size = os.fstat(f.fileno()).st_size
+
+    if fmt_chunk is None or len(fmt_chunk) < 16:
+        return None
+    format_tag, _, sample_rate, _, block_align = struct.unpack('<HHIIH', fmt_chunk[:14])
+    if format_tag not in WAV_SLICEABLE_FORMATS or not block_align or not sample_rate:
+        return None
+
+    # Streamed recordings may leave the data size unset (0 or 0xFFFFFFFF), so fall back to the
+    # file size; otherwise trust the header but never read past the end of the file
+    data_size = file_size - data_offset
+    if chunk_size not in (0, 0xFFFFFFFF):
+        data_size = min(chunk_size, data_size)
+    return fmt_chunk, data_offset, data_size, block_align, sample_rate
+
+
+def wav_segment(path, start_time, duration):
+    """Return (riff_header, byte_offset, byte_count) for a segment of an uncompressed WAV file.
+
+    Returns None when the file needs ffmpeg (compressed or unrecognised formats).
+    """
+    st = os.stat(path)
+    cache_key = str(path)
+    cached = WAV_LAYOUT_CACHE.get(cache_key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        layout = cached[2]
+    else:
+        layout = read_wav_layout(path)
+        WAV_LAYOUT_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, layout)
+    if layout is None:
+        return None
+
+    fmt_chunk, data_offset, data_size, block_align, sample_rate = layout
+    total_frames = data_size // block_align
+    first_frame = min(max(round(start_time * sample_rate), 0), total_frames)
+    last_frame = min(max(round((start_time + duration) * sample_rate), first_frame), total_frames)
+    byte_count = (last_frame - first_frame) * block_align
+
+    fmt_padding = b'\0' * (len(fmt_chunk) & 1)
+    riff_size = 4 + 8 + len(fmt_chunk) + len(fmt_padding) + 8 + byte_count
+    riff_header = b''.join((
+        b'RIFF', struct.pack('<I', riff_size), b'WAVE',
+        b'fmt ', struct.pack('<I', len(fmt_chunk)), fmt_chunk, fmt_padding,
+        b'data', struct.pack('<I', byte_count)
+    ))
+    return riff_header, data_offset + first_frame * block_align, byte_count
+
+
+def copy_file_slice(path, offset, size, out):
+    """Copy size bytes starting at offset from path to the writable out"""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        remaining = size
+        while remaining > 0:
+            chunk = f.read(min(AUDIO_STREAM_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            out.write(chunk)
+            remaining -= len(chunk)
+
+
+def rfind_in_file(f, needle):
+    """Return the offset of the last occurrence of needle in the binary file f, else -1.
+
+    The file is read backwards from EOF in HYDRATE_SCAN_CHUNK_SIZE blocks, so a match near the
+    end is found without reading the rest.
+    """
+    end = f.seek(0, os.SEEK_END)
+    # Each block also re-reads the start of the block after it, for matches across the boundary
+    overlap = len(needle) - 1
+    while end > 0:
+        start = max(end - HYDRATE_SCAN_CHUNK_SIZE, 0)
+        f.seek(start)
+        index = f.read(end - start + overlap).rfind(needle)
+        if index != -1:
+            return start + index
+        end = start
+    return -1
+
+
+def remove_audio_segments():
+    """Delete the temp files behind cached ffmpeg audio segments"""
+    with AUDIO_SEGMENT_LOCK:
+        segment_paths = list(AUDIO_SEGMENT_CACHE.values())
+        AUDIO_SEGMENT_CACHE.clear()
+    for segment_path in segment_paths:
+        try:
+            os.unlink(segment_path)
+        except OSError:
+            pass
+
+
+atexit.register(remove_audio_segments)
+
+
+def parse_xml_part(data):
+    """Parse an xlsx XML part, returning (root, [(prefix, uri), ...]) for every namespace it declares"""
+    if LXML_AVAILABLE:
+        # lxml keeps each element's namespace declarations on the tree itself
+        return ET.fromstring(data), []
+    namespaces = []
+    parser = ET.iterparse(io.BytesIO(data), events=('start-ns',))
+    for _, namespace in parser:
+        namespaces.append(namespace)
+    register_xml_namespaces(namespaces)
+    return parser.root, namespaces
+
+
+def register_xml_namespaces(namespaces):
+    """Register prefixes with ElementTree (once each) so serialized parts keep their original prefixes.
+
+    Registration mutates ElementTree's global map; callers must hold CRX_WORKBOOK_LOCK
+    (or be running at import time).
+    """
+    for prefix, uri in namespaces:
+        if prefix and (prefix, uri) not in REGISTERED_NAMESPACES:
+            ET.register_namespace(prefix, uri)
+            REGISTERED_NAMESPACES.add((prefix, uri))
+
+
+def serialize_xml_part(root, namespaces):
+    """Serialize an xlsx XML part, re-declaring root namespaces that ElementTree would drop.
+
+    ElementTree only writes namespaces that are used by an element or attribute, but
+    Excel rejects parts whose mc:Ignorable lists a prefix that is no longer declared.
+    """
+    if LXML_AVAILABLE:
+        return ET.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+    xml = ET.tostring(root, encoding='unicode')
+    tag_end = xml.index('>')
+    if xml[tag_end - 1] == '/':
+        tag_end -= 1
+    root_tag = xml[:tag_end]
+    missing = ''.join(f' xmlns:{prefix}="{uri}"' for prefix, uri in namespaces
+                      if prefix and f' xmlns:{prefix}=' not in root_tag)
+    return (XML_DECLARATION + root_tag + missing + xml[tag_end:]).encode('utf-8')
+
+
+def active_sheet_part(parts):
+    """Return the zip member name of the workbook's active worksheet"""
+    workbook = ET.fromstring(parts['xl/workbook.xml'])
+    view = workbook.find('a:bookViews/a:workbookView', NAMESPACES)
+    active_tab = int(view.get('activeTab', 0)) if view is not None else 0
+    sheets = workbook.findall('a:sheets/a:sheet', NAMESPACES)
+    rel_id = sheets[min(active_tab, len(sheets) - 1)].get(REL_ID_ATTR)
+    rels = ET.fromstring(parts['xl/_rels/workbook.xml.rels'])
+    for rel in rels:
+        if rel.get('Id') == rel_id:
+            target = rel.get('Target')
+            if target.startswith('/'):
+                return target[1:]
+            return posixpath.normpath(posixpath.join('xl', target))
+    raise Exception(f"Active worksheet {rel_id} not found in workbook relationships")
+
+
+def load_crx_workbook(crx_path):
+    """Read an xlsx file into a cache entry holding its raw parts and the parsed active sheet"""
+    with ZipFile(crx_path) as zf:
+        parts = {info.filename: zf.read(info) for info in zf.infolist()}
+    sheet_part = active_sheet_part(parts)
+    sheet, namespaces = parse_xml_part(parts[sheet_part])
+    return {
+        'parts': parts,
+        'sheetPart': sheet_part,
+        'sheet': sheet,
+        'namespaces': namespaces,
+        'sharedStrings': None,
+    }
+
+
+def write_xlsx_parts(parts, path):
+    """Zip parts ({name: bytes}) into path, replacing the file in one step"""
+    fd, tmp_path = tempfile.mkstemp(suffix='.xlsx', dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'wb') as f, ZipFile(f, 'w', ZIP_DEFLATED, compresslevel=CRX_ZIP_COMPRESSLEVEL) as zf:
+            for name, data in parts.items():
+                zf.writestr(name, data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_crx_workbook(entry, crx_path):
+    """Write a cached workbook back to disk with its edited parts reserialized"""
+    updated = {entry['sheetPart']: serialize_xml_part(entry['sheet'], entry['namespaces'])}
+    strings = entry['sharedStrings']
+    if strings is not None and strings['dirty']:
+        updated[SHARED_STRINGS_PART] = serialize_xml_part(strings['root'], strings['namespaces'])
+    entry['parts'].update(updated)
+    write_xlsx_parts(entry['parts'], crx_path)
+    if strings is not None:
+        strings['dirty'] = False
+
+
+def get_crx_workbook(crx_path):
+    """Return the cached workbook for crx_path, reloading it if the file changed on disk.
+
+    Callers must hold CRX_WORKBOOK_LOCK.
+    """
+    cache_key = str(crx_path)
+    mtime_ns = os.stat(crx_path).st_mtime_ns
+    entry = CRX_WORKBOOK_CACHE.get(cache_key)
+    # Unsaved edits win over the file on disk; they are written on the next flush
+    if entry is None or (not entry['dirty'] and entry['mtime_ns'] != mtime_ns):
+        entry = load_crx_workbook(crx_path)
+        entry.update(mtime_ns=mtime_ns, dirty=False, timer=None)
+        CRX_WORKBOOK_CACHE[cache_key] = entry
+    return entry
+
+
+def get_crx_template(template_path):
+    """Return the parsed CRX template, re-reading it only when the file changes"""
+    st = os.stat(template_path)
+    cache_key = (str(template_path), st.st_mtime_ns, st.st_size)
+    template = CRX_TEMPLATE_CACHE.get(cache_key)
+    if template is None:
+        CRX_TEMPLATE_CACHE.clear()
+        template = CRX_TEMPLATE_CACHE[cache_key] = load_crx_workbook(template_path)
+    return template
+
+
+def create_crx_workbook(crx_path, template_path):
+    """Write a new workbook at crx_path from the cached template and cache it.
+
+    Callers must hold CRX_WORKBOOK_LOCK.
+    """
+    template = get_crx_template(template_path)
+    # The sheet tree is mutated by later edits (deepcopy of a parsed tree is cheaper than
+    # re-parsing it); the part bytes are only ever replaced, so the dict is shallow-copied
+    entry = dict(template, parts=dict(template['parts']), sheet=copy.deepcopy(template['sheet']), sharedStrings=None)
+    # Nothing has been edited yet, so the template's parts are written without reserializing
+    write_xlsx_parts(entry['parts'], crx_path)
+    entry.update(mtime_ns=os.stat(crx_path).st_mtime_ns, dirty=False, timer=None)
+    CRX_WORKBOOK_CACHE[str(crx_path)] = entry
+
+
+def column_number(column):
+    """Convert a column reference ('A', 'H', 'AA') to its 1-based number"""
+    number = 0
+    for ch in column:
+        number = number * 26 + ord(ch) - 64
+    return number
+
+
+def sheet_row(sheet, row_num):
+    """Return the <row> element for row_num, creating it in order if missing"""
+    sheet_data = sheet.find(SHEET_DATA_TAG)
+    rows = sheet_data.findall(ROW_TAG)
+    row_nums = [int(row.get('r')) for row in rows]
+    pos = bisect_left(row_nums, row_num)
+    if pos < len(rows) and row_nums[pos] == row_num:
+        return rows[pos]
+    row = ET.Element(ROW_TAG, {'r': str(row_num)})
+    sheet_data.insert(pos, row)
+    extend_sheet_dimension(sheet, row_num)
+    return row
+
+
+def row_cells(row, columns):
+    """Return {column: <c> element} for columns in row, creating missing cells in column order"""
+    row_num = row.get('r')
+    # A cell ref is its column letters followed by this row's number, so no regex is needed
+    column_end = -len(row_num)
+    cells = {cell.get('r')[:column_end]: cell for cell in row.findall(C_TAG)}
+    missing = [column for column in columns if column not in cells]
+    if missing:
+        for column in missing:
+            cells[column] = ET.Element(C_TAG, {'r': f"{column}{row_num}"})
+        ordered = sorted(cells.items(), key=lambda item: column_number(item[0]))
+        for cell in list(row):
+            row.remove(cell)
+        row.extend(cell for _, cell in ordered)
+        # The spans hint would no longer cover the new cells
+        row.attrib.pop('spans', None)
+    return cells
+
+
+def extend_sheet_dimension(sheet, row_num):
+    """Grow the sheet's <dimension> ref so it covers row_num"""
+    dimension = sheet.find(DIMENSION_TAG)
+    if dimension is None:
+        return
+    match = CELL_RANGE_RE.fullmatch(dimension.get('ref', ''))
+    if match is None:
+        return
+    first_column, first_row, last_column, last_row = match.groups()
+    if last_column is None:
+        last_column, last_row = first_column, first_row
+    if int(last_row) < row_num:
+        dimension.set('ref', f"{first_column}{first_row}:{last_column}{row_num}")
+
+
+def shared_strings(entry):
+    """Return the workbook's shared string table ({'root', 'texts', 'index', ...}), parsed on first use.
+
+    'root' is None when the workbook has no sharedStrings part.
+    """
+    if entry['sharedStrings'] is None:
+        data = entry['parts'].get(SHARED_STRINGS_PART)
+        root, namespaces = parse_xml_part(data) if data is not None else (None, [])
+        texts = []
+        index = {}
+        if root is not None:
+            for i, si in enumerate(root.findall(SI_TAG)):
+                text = ''.join(t.text or '' for t in si.iter(T_TAG))
+                texts.append(text)
+                # Only plain entries are reused; rich text would carry its formatting along
+                if len(si) == 1 and si[0].tag == T_TAG:
+                    index.setdefault(text, i)
+        entry['sharedStrings'] = {'root': root, 'namespaces': namespaces, 'texts': texts, 'index': index, 'dirty': False}
+    return entry['sharedStrings']
+
+
+def cell_text(entry, cell):
+    """Return a cell's value as text ('' when empty)"""
+    cell_type = cell.get('t')
+    if cell_type == 'inlineStr':
+        return ''.join(t.text or '' for t in cell.iter(T_TAG))
+    value = cell.find(V_TAG)
+    if value is None or value.text is None:
+        return ''
+    if cell_type == 's':
+        return shared_strings(entry)['texts'][int(value.text)]
+    return value.text
+
+
+def set_text_element(parent, text):
+    """Append a <t> holding text to parent"""
+    t = ET.SubElement(parent, T_TAG)
+    t.text = text
+    if text != text.strip():
+        t.set(XML_SPACE_ATTR, 'preserve')
+
+
+def set_cell_text(entry, cell, text):
+    """Store text in a cell, keeping its style.
+
+    Text goes through the shared string table (one <si> per distinct string) when the
+    workbook has one, and is written inline otherwise.
+    """
+    strings = shared_strings(entry)
+    root = strings['root']
+    references = -1 if cell.get('t') == 's' else 0
+    for child in list(cell):
+        cell.remove(child)
+    if not text:
+        cell.attrib.pop('t', None)
+    elif root is None:
+        cell.set('t', 'inlineStr')
+        set_text_element(ET.SubElement(cell, IS_TAG), str(text))
+    else:
+        text = str(text)
+        index = strings['index'].get(text)
+        if index is None:
+            index = len(strings['texts'])
+            set_text_element(ET.SubElement(root, SI_TAG), text)
+            strings['texts'].append(text)
+            strings['index'][text] = index
+            root.set('uniqueCount', str(len(strings['texts'])))
+            # The cell now points past the saved table, even when its reference count is unchanged
+            strings['dirty'] = True
+        cell.set('t', 's')
+        ET.SubElement(cell, V_TAG).text = str(index)
+        references += 1
+    if references and root is not None:
+        root.set('count', str(max(int(root.get('count', 0)) + references, 0)))
+        strings['dirty'] = True
+
+
+def schedule_crx_flush(crx_path):
+    """Mark the cached workbook dirty and (re)start its save timer. Callers must hold CRX_WORKBOOK_LOCK."""
+    cache_key = str(crx_path)
+    entry = CRX_WORKBOOK_CACHE[cache_key]
+    entry['dirty'] = True
+    if entry['timer'] is not None:
+        entry['timer'].cancel()
+    timer = threading.Timer(CRX_FLUSH_DELAY, flush_crx_workbook, args=(cache_key,))
+    timer.daemon = True
+    entry['timer'] = timer
+    timer.start()
+
+
+def flush_crx_workbook(cache_key):
+    """Save a cached workbook if it has pending edits"""
+    with CRX_WORKBOOK_LOCK:
+        entry = CRX_WORKBOOK_CACHE.get(cache_key)
+        if entry is None or not entry['dirty']:
+            return
+        entry['timer'] = None
+        try:
+            write_crx_workbook(entry, cache_key)
+            entry['mtime_ns'] = os.stat(cache_key).st_mtime_ns
+            entry['dirty'] = False
+        except Exception as e:
+            # Typically the workbook is open in Excel; keep the edits and retry later
+            print(f"Error saving CRX workbook {cache_key}: {e}")
+            schedule_crx_flush(cache_key)
+
+
+def flush_all_crx_workbooks():
+    """Save every workbook with pending edits (runs at shutdown)"""
+    for cache_key in list(CRX_WORKBOOK_CACHE):
+        entry = CRX_WORKBOOK_CACHE[cache_key]
+        if entry['timer'] is not None:
+            entry['timer'].cancel()
+        flush_crx_workbook(cache_key)
+
+
+atexit.register(flush_all_crx_workbooks)
+
+
+def schedule_reviewed_status_flush():
+    """Mark the reviewed status dirty and (re)start its save timer. Callers must hold SETTINGS_LOCK."""
+    state = REVIEWED_STATUS_STATE
+    state['dirty'] = True
+    if state['timer'] is not None:
+        state['timer'].cancel()
+    timer = threading.Timer(SETTINGS_FLUSH_DELAY, flush_reviewed_status)
+    timer.daemon = True
+    state['timer'] = timer
+    timer.start()
+
+
+def flush_reviewed_status():
+    """Write pending reviewed-status changes into the file shared by every book"""
+    with SETTINGS_LOCK:
+        state = REVIEWED_STATUS_STATE
+        if not state['dirty']:
+            return
+        state['timer'] = None
+        try:
+            # Other books' entries may have been written by another viewer instance
+            all_data = {}
+            if REVIEWED_STATUS_FILE.exists():
+                all_data = load_json_file(REVIEWED_STATUS_FILE)
+            all_data[BASE_DIR.name] = serialize_reviewed_status(state['chapters'])
+
+            tmp_path = REVIEWED_STATUS_FILE.with_suffix('.tmp')
+            tmp_path.write_bytes(dumps_json(all_data))
+            os.replace(tmp_path, REVIEWED_STATUS_FILE)
+            state['mtime_ns'] = os.stat(REVIEWED_STATUS_FILE).st_mtime_ns
+            state['dirty'] = False
+        except Exception as e:
+            # Keep the pending changes and retry later
+            print(f"Error saving reviewed status: {e}")
+            schedule_reviewed_status_flush()
+
+
+atexit.register(flush_reviewed_status)
+
+
+def parse_index(value):
+    """Return an int word index from an int or integer string, else None"""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = value.strip()
+        if INTEGER_RE.fullmatch(value):
+            return int(value)
+    return None
+
+
+def parse_index_range(range_text):
+    """Return (start, end) from a report range like "120-135" or a single index, else (None, None)"""
+    if not range_text:
+        return None, None
+
+    match = INDEX_RANGE_RE.search(range_text)
+    if not match:
+        return None, None
+
+    start, end = match.groups()
+    start = int(start)
+    return start, int(end) if end else start
+
+
+def set_report_book_range(item, range_text):
+    item['bookRange'] = range_text
+    item['bookRangeStart'], item['bookRangeEnd'] = parse_index_range(range_text)
+
+
+def set_report_timing(item, timing_str):
+    item['timing'] = timing_str
+    # Parse timing: "870.530s → 871.050s (Δ 0.520s)"
+    timing_match = TIMING_RE.search(timing_str)
+    if timing_match:
+        item['startTime'] = float(timing_match.group(1))
+        item['endTime'] = float(timing_match.group(2))
 
-for prefix, uri in [('', EXCEL_NS), ('r', REL_NS), ('mc', MC_NS), ('x14ac', X14AC_NS), ('xr', XR_NS), ('xr2', XR2_NS), ('xr3', XR3_NS)]:
-    ET.register_namespace(prefix, uri)
+
+def set_report_sentence_stats(report_data, value):
+    # Parse: "Sentences : 277 (Avg WER 2.30%, Max WER 100.00%, Flagged 19)"
+    match = REPORT_SENTENCE_STATS_RE.search(value)
+    if match:
+        stats = report_data['stats']
+        stats['sentenceCount'], stats['avgWer'], stats['maxWer'], stats['flaggedCount'] = match.groups()
+
+
+def set_report_paragraph_stats(report_data, value):
+    # Parse: "Paragraphs: 72 (Avg WER 3.53%, Avg Coverage 98.93%)"
+    match = REPORT_PARAGRAPH_STATS_RE.search(value)
+    if match:
+        stats = report_data['stats']
+        stats['paragraphCount'], stats['paragraphAvgWer'], stats['avgCoverage'] = match.groups()
+
+
+def report_text_setter(key):
+    def setter(item, value):
+        item[key] = value
+    return setter
+
+
+# Report item field label (text before the first ':') -> setter(item, value)
+REPORT_SENTENCE_FIELDS = {
+    'Book range': set_report_book_range,
+    'Script range': report_text_setter('scriptRange'),
+    'Timing': set_report_timing,
+    'Book': report_text_setter('bookText'),
+    'Script': report_text_setter('scriptText'),
+    'Excerpt': report_text_setter('excerpt'),
+}
+REPORT_PARAGRAPH_FIELDS = {
+    'Book range': set_report_book_range,
+    'Book': report_text_setter('bookText'),
+}
+
+
+@lru_cache(maxsize=4096)
+def format_percent(fraction, digits=1):
+    """Format a 0-1 ratio as a percentage label (most sentences repeat 0.0%)"""
+    return f"{fraction * 100:.{digits}f}%"
+
+
+UNIX_EPOCH = datetime(1970, 1, 1)
+
+
+@lru_cache(maxsize=1024)
+def format_timestamp_ns(timestamp_ns):
+    """Format a time.time_ns() value as a naive UTC ISO string (the reviewed-status format)"""
+    return (UNIX_EPOCH + timedelta(microseconds=timestamp_ns // 1000)).isoformat()
+
+
+def serialize_reviewed_status(chapters):
+    """Return chapters with in-memory time_ns timestamps formatted as ISO strings"""
+    output = {}
+    for name, entry in chapters.items():
+        timestamp = entry.get('timestamp') if isinstance(entry, dict) else None
+        if isinstance(timestamp, int):
+            entry = dict(entry, timestamp=format_timestamp_ns(timestamp))
+        output[name] = entry
+    return output
+
+
+# Compact per-word alignment op (slots, no per-instance dict). orjson serializes it as a JSON
+# object directly; the fallback encoders go through json_default
+@dataclass(slots=True)
+class WordOp:
+    op: str
+    reason: str
+    bookWord: str
+    asrWord: str
+    bookIdx: int
+    asrIdx: int
+
+
+# Report header labels (text before the first ':') -> setter(report_data, value)
+REPORT_HEADER_FIELDS = {
+    'Audio': report_text_setter('audioPath'),
+    'Script': report_text_setter('scriptPath'),
+    'Book Index': report_text_setter('bookIndex'),
+    'Created': report_text_setter('created'),
+    'Sentences': set_report_sentence_stats,
+    'Paragraphs': set_report_paragraph_stats,
+}
+
+if not LXML_AVAILABLE:
+    # ElementTree's default_namespace option rejects unqualified attributes (r="A1"), so the
+    # spreadsheet namespace is registered as the empty prefix instead
+    ET.register_namespace('', EXCEL_NS)
+    register_xml_namespaces([('r', REL_NS), ('mc', MC_NS), ('x14ac', X14AC_NS), ('xr', XR_NS), ('xr2', XR2_NS), ('xr3', XR3_NS)])
+
+
+class ValidationReportServer(ThreadingHTTPServer):
+    # The browser opens several connections at once (report, audio ranges, static files);
+    # the default listen backlog of 5 can refuse some of them under a burst
+    request_queue_size = 64
 
 
 class ValidationReportHandler(BaseHTTPRequestHandler):
+    # Keep connections open between requests; every response sets Content-Length
+    protocol_version = 'HTTP/1.1'
+    # Each open connection holds a server thread, so idle keep-alive sockets are dropped
+    timeout = KEEP_ALIVE_TIMEOUT
+
     @staticmethod
     def load_reviewed_status():
         """Load reviewed status from AppData"""
-        if REVIEWED_STATUS_FILE.exists():
+        with SETTINGS_LOCK:
+            state = REVIEWED_STATUS_STATE
             try:
-                with open(REVIEWED_STATUS_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Key by book name
-                    book_name = BASE_DIR.name
-                    return data.get(book_name, {})
-            except Exception as e:
-                print(f"Error loading reviewed status: {e}")
-        return {}
+                mtime_ns = os.stat(REVIEWED_STATUS_FILE).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            # Pending edits win over the file; otherwise re-read only when it changed on disk
+            if state['chapters'] is None or (not state['dirty'] and state['mtime_ns'] != mtime_ns):
+                state['chapters'] = {}
+                state['mtime_ns'] = mtime_ns
+                if mtime_ns is not None:
+                    try:
+                        data = load_json_file(REVIEWED_STATUS_FILE)
+                        # Key by book name
+                        book_name = BASE_DIR.name
+                        state['chapters'] = data.get(book_name, {})
+                    except Exception as e:
+                        print(f"Error loading reviewed status: {e}")
+            return dict(state['chapters'])
 
     @staticmethod
     def load_ignored_errors():
-        """Load ignored error patterns for the current book"""
-        if IGNORED_ERRORS_FILE.exists():
+        """Load ignored error patterns for the current book (a frozenset shared between requests)"""
+        with SETTINGS_LOCK:
+            state = IGNORED_ERRORS_STATE
             try:
-                with open(IGNORED_ERRORS_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    book_name = BASE_DIR.name
-                    return set(data.get(book_name, []))
-            except Exception as e:
-                print(f"Error loading ignored errors: {e}")
-        return set()
+                mtime_ns = os.stat(IGNORED_ERRORS_FILE).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if state['patterns'] is None or state['mtime_ns'] != mtime_ns:
+                patterns = frozenset()
+                if mtime_ns is not None:
+                    try:
+                        data = load_json_file(IGNORED_ERRORS_FILE)
+                        book_name = BASE_DIR.name
+                        patterns = frozenset(data.get(book_name, []))
+                    except Exception as e:
+                        print(f"Error loading ignored errors: {e}")
+                state['patterns'] = patterns
+                state['mtime_ns'] = mtime_ns
+            return state['patterns']
 
     @staticmethod
     def save_ignored_errors(pattern_keys):
         """Persist ignored error patterns for the current book"""
-        try:
-            all_data = {}
-            if IGNORED_ERRORS_FILE.exists():
-                with open(IGNORED_ERRORS_FILE, 'r', encoding='utf-8') as f:
-                    all_data = json.load(f)
+        with SETTINGS_LOCK:
+            try:
+                all_data = {}
+                if IGNORED_ERRORS_FILE.exists():
+                    all_data = load_json_file(IGNORED_ERRORS_FILE)
 
-            book_name = BASE_DIR.name
-            all_data[book_name] = list(pattern_keys)
+                book_name = BASE_DIR.name
+                all_data[book_name] = list(pattern_keys)
 
-            with open(IGNORED_ERRORS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(all_data, f, indent=2)
-        except Exception as e:
-            print(f"Error saving ignored errors: {e}")
+                IGNORED_ERRORS_FILE.write_bytes(dumps_json(all_data))
+                IGNORED_ERRORS_STATE['patterns'] = frozenset(pattern_keys)
+                IGNORED_ERRORS_STATE['mtime_ns'] = os.stat(IGNORED_ERRORS_FILE).st_mtime_ns
+            except Exception as e:
+                print(f"Error saving ignored errors: {e}")
 
     @staticmethod
     def save_reviewed_status(reviewed_chapters):
-        """Save reviewed status to AppData"""
-        try:
-            # Load existing data
-            all_data = {}
-            if REVIEWED_STATUS_FILE.exists():
-                with open(REVIEWED_STATUS_FILE, 'r', encoding='utf-8') as f:
-                    all_data = json.load(f)
-
-            # Update for current book
-            book_name = BASE_DIR.name
-            all_data[book_name] = reviewed_chapters
-
-            # Save back
-            with open(REVIEWED_STATUS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(all_data, f, indent=2)
-        except Exception as e:
-            print(f"Error saving reviewed status: {e}")
+        """Save reviewed status to AppData (written after SETTINGS_FLUSH_DELAY)"""
+        with SETTINGS_LOCK:
+            REVIEWED_STATUS_STATE['chapters'] = reviewed_chapters
+            schedule_reviewed_status_flush()
 
     def do_GET(self):
         parsed_path = urlparse(self.path)
@@ -157,31 +963,53 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
         if path.startswith('/api/export/'):
             chapter_name = path[len('/api/export/'):]
             print(f"Matched export route, chapter: {chapter_name}")
-            self.handle_export_audio(chapter_name)
+            with CRX_ENTRY_LOCK:
+                self.handle_export_audio(chapter_name)
         elif path.startswith('/api/crx/'):
             chapter_name = path[len('/api/crx/'):]
             print(f"Matched CRX route, chapter: {chapter_name}")
-            self.handle_add_to_crx(chapter_name)
+            with CRX_ENTRY_LOCK:
+                self.handle_add_to_crx(chapter_name)
         elif path.startswith('/api/reviewed/'):
             chapter_name = path[len('/api/reviewed/'):]
             print(f"Matched reviewed route, chapter: {chapter_name}")
-            self.handle_mark_reviewed(chapter_name)
+            with SETTINGS_LOCK:
+                self.handle_mark_reviewed(chapter_name)
         elif path == '/api/reset-reviews':
             print(f"Matched reset reviews route")
-            self.handle_reset_reviews()
+            with SETTINGS_LOCK:
+                self.handle_reset_reviews()
         elif path == '/api/errors/ignore':
-            self.handle_ignore_error()
+            with SETTINGS_LOCK:
+                self.handle_ignore_error()
         else:
             print(f"No route matched for path: {path}")
+            # The request body was not read, so the connection cannot be reused
+            self.close_connection = True
             self.send_error(404)
 
     @staticmethod
     def build_pattern_key(kind, book_text, script_text):
         return f"{kind}|{book_text}|{script_text}"
 
+    @staticmethod
+    def word_ops_from_diff(diff):
+        """Flatten diff ops into the per-word ops consumed by the UI highlighter"""
+        word_ops = []
+        for op in diff.get('ops') or []:
+            kind = op.get('op')
+            for token in op.get('tokens') or []:
+                if kind == 'equal':
+                    word_ops.append({'op': 'match', 'bookWord': token, 'asrWord': token})
+                elif kind == 'delete':
+                    word_ops.append({'op': 'del', 'bookWord': token, 'asrWord': ''})
+                elif kind == 'insert':
+                    word_ops.append({'op': 'ins', 'bookWord': '', 'asrWord': token})
+        return word_ops
+
     def serve_reviewed_status(self):
         """Serve reviewed status for all chapters"""
-        reviewed = self.load_reviewed_status()
+        reviewed = serialize_reviewed_status(self.load_reviewed_status())
         self.send_json_response(reviewed)
 
     def serve_ignored_errors(self):
@@ -198,7 +1026,7 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
         # Read POST data
         content_length = int(self.headers['Content-Length'])
         post_data = self.rfile.read(content_length)
-        params = json.loads(post_data.decode('utf-8'))
+        params = loads_json(post_data)
 
         reviewed_status = params.get('reviewed', True)
 
@@ -209,7 +1037,8 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
             # Update status for this chapter
             all_reviewed[chapter_name] = {
                 'reviewed': reviewed_status,
-                'timestamp': datetime.utcnow().isoformat()
+                # Formatted only when the status is served or written
+                'timestamp': time.time_ns()
             }
 
             # Save back
@@ -249,7 +1078,7 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
         try:
             content_length = int(self.headers.get('Content-Length', 0))
             raw = self.rfile.read(content_length)
-            params = json.loads(raw.decode('utf-8'))
+            params = loads_json(raw)
 
             kind = params.get('type')
             book_text = params.get('book', '')
@@ -257,7 +1086,7 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
             ignore = bool(params.get('ignore', True))
 
             key = self.build_pattern_key(kind, book_text, script_text)
-            ignored = self.load_ignored_errors()
+            ignored = set(self.load_ignored_errors())
 
             if ignore:
                 ignored.add(key)
@@ -274,8 +1103,7 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
 
     def serve_static_file(self, file_path):
         """Serve static files (CSS, JS)"""
-        static_dir = SCRIPT_DIR / 'static'
-        full_path = static_dir / file_path
+        full_path = STATIC_DIR / file_path
 
         if not full_path.exists() or not full_path.is_file():
             self.send_error(404)
@@ -289,32 +1117,60 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
             content_type = 'application/javascript'
 
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            self.send_response(200)
-            self.send_header('Content-type', content_type)
-            self.send_header('Content-Length', str(len(content.encode())))
-            self.end_headers()
-            self.wfile.write(content.encode())
+            with open(full_path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                size = st.st_size
+                # Text assets compress well; each file version is gzipped once and kept in memory
+                gzipped = None
+                if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                    cache_key = str(full_path)
+                    cached = STATIC_GZIP_CACHE.get(cache_key)
+                    if cached and cached[0] == st.st_mtime_ns and cached[1] == size:
+                        gzipped = cached[2]
+                    else:
+                        gzipped = gzip.compress(f.read(), compresslevel=9)
+                        STATIC_GZIP_CACHE[cache_key] = (st.st_mtime_ns, size, gzipped)
+
+                # Validator from the file's identity, so edits are picked up without hashing the body;
+                # each encoding gets its own tag
+                etag = f'"{st.st_mtime_ns:x}-{size:x}{"-gz" if gzipped is not None else ""}"'
+                if self.send_not_modified(etag, vary_encoding=True):
+                    return
+                self.send_response(200)
+                self.send_header('Content-type', content_type)
+                self.send_validator(etag)
+                self.send_header('Vary', 'Accept-Encoding')
+                if gzipped is not None:
+                    self.send_header('Content-Encoding', 'gzip')
+                    self.send_header('Content-Length', str(len(gzipped)))
+                    self.end_headers()
+                    self.wfile.write(gzipped)
+                else:
+                    self.send_header('Content-Length', str(size))
+                    self.end_headers()
+                    self.connection.sendfile(f, 0, size)
         except Exception as e:
             print(f"Error serving static file {file_path}: {e}")
             self.send_error(500)
 
     def serve_index(self):
         """Serve the main HTML page"""
-        index_path = SCRIPT_DIR / 'static' / 'index.html'
-        try:
-            with open(index_path, 'r', encoding='utf-8') as f:
-                html = f.read()
-
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            self.wfile.write(html.encode())
-        except Exception as e:
-            print(f"Error loading index.html: {e}")
-            self.send_error(500)
+        gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+        etag = INDEX_HTML_GZIP_ETAG if gzipped else INDEX_HTML_ETAG
+        if self.send_not_modified(etag, vary_encoding=True):
+            return
+        body = INDEX_HTML_BYTES
+        self.send_response(200)
+        self.send_header('Content-type', 'text/html')
+        # Browsers revalidate on every load, so a restarted server with a new page is picked up
+        self.send_validator(etag)
+        if gzipped:
+            body = INDEX_HTML_GZIP
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
 
     # -----------------------
     # Error aggregation helpers
@@ -416,20 +1272,61 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
         sentence['diff'] = {'ops': filtered_ops}
         return sentence, had_errors
 
+    @staticmethod
+    def iter_chapter_hydrate_paths():
+        """Yield (chapter_name, hydrate_path) in natural order for each chapter directory with a hydrate file"""
+        # Adding or removing a chapter directory changes BASE_DIR's mtime; a hydrate file appearing
+        # inside a chapter is picked up once the TTL runs out
+        base_key = str(BASE_DIR)
+        base_mtime_ns = os.stat(base_key).st_mtime_ns
+        listing = CHAPTER_LIST_CACHE.get(base_key)
+        if listing and listing[0] == base_mtime_ns and time.monotonic() < listing[1]:
+            yield from listing[2]
+            return
+
+        with CHAPTER_LIST_LOCK:
+            # The sidebar and overview requests arrive together; the second reuses the first's scan
+            now = time.monotonic()
+            listing = CHAPTER_LIST_CACHE.get(base_key)
+            if listing and listing[0] == base_mtime_ns and now < listing[1]:
+                chapters = listing[2]
+            else:
+                chapters = ValidationReportHandler.scan_chapter_hydrate_paths()
+                CHAPTER_LIST_CACHE[base_key] = (base_mtime_ns, now + CHAPTER_LIST_TTL, chapters)
+        yield from chapters
+
+    @staticmethod
+    def scan_chapter_hydrate_paths():
+        """List (chapter_name, hydrate_path) pairs in BASE_DIR in natural order"""
+        chapters = []
+        # scandir entries carry the d_type from the directory listing, so is_dir() needs no stat
+        with os.scandir(BASE_DIR) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                # Adding or removing the hydrate file changes the chapter directory's mtime, which
+                # on Windows comes with the listing, so the exists() probe only reruns after a change
+                mtime_ns = entry.stat().st_mtime_ns
+                cached = CHAPTER_SCAN_CACHE.get(entry.path)
+                if cached is None or cached[0] != mtime_ns:
+                    hydrate_path = Path(entry.path) / f"{entry.name}.align.hydrate.json"
+                    cached = (mtime_ns, hydrate_path if hydrate_path.exists() else None)
+                    CHAPTER_SCAN_CACHE[entry.path] = cached
+                if cached[1] is not None:
+                    chapters.append((entry.name, cached[1]))
+
+        # Sorted once per scan, so warm requests reuse the order without recomputing sort keys
+        chapters.sort(key=lambda chapter: ValidationReportHandler.natural_sort_key(chapter[0]))
+        return chapters
+
     def iterate_hydrate_chapters(self):
         """Yield (chapter_name, hydrate_data) for each hydrate file"""
-        for item in BASE_DIR.iterdir():
-            if not item.is_dir():
-                continue
-            hydrate_path = item / f"{item.name}.align.hydrate.json"
-            if not hydrate_path.exists():
-                continue
+        for chapter_name, hydrate_path in self.iter_chapter_hydrate_paths():
             try:
-                with open(hydrate_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                yield item.name, data
+                data = load_json_file(hydrate_path)
+                yield chapter_name, data
             except Exception as e:
-                print(f"Failed to load hydrate for {item.name}: {e}")
+                print(f"Failed to load hydrate for {chapter_name}: {e}")
 
     def collect_error_patterns(self, ignored):
         patterns = {}
@@ -516,89 +1413,174 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
             print(traceback.format_exc())
             self.send_json_response({'error': str(e)}, 500)
 
-    def extract_hydrate_metrics(self, hydrate_path):
+    def summarize_sentences(self, sentences, ignored):
+        """Return (count, flagged count, WER sum of flagged) after applying ignores"""
+        count = 0
+        flagged = 0
+        total_wer = 0
+        for sent in sentences:
+            count += 1
+            filtered, _ = self.apply_ignore_to_sentence(sent, ignored)
+            if filtered.get('status', 'ok') == 'ok':
+                continue
+            # Average WER only covers sentences that still have errors after ignoring patterns
+            flagged += 1
+            if 'metrics' in sent:
+                total_wer += sent['metrics'].get('wer', 0)
+        return count, flagged, total_wer
+
+    def extract_hydrate_metrics(self, hydrate_path, ignored=None):
         """Extract summary metrics from hydrate.json"""
         try:
-            with open(hydrate_path, 'r', encoding='utf-8') as f:
-                hydrate_data = json.load(f)
-
-            sentences = hydrate_data.get('sentences', [])
-            paragraphs = hydrate_data.get('paragraphs', [])
-
-            ignored = self.load_ignored_errors()
-
-            # Count flagged sentences after applying ignores
-            filtered_sentences = [self.apply_ignore_to_sentence(s, ignored)[0] for s in sentences]
-            flagged_sentences = [s for s in filtered_sentences if s.get('status', 'ok') != 'ok']
-
-            # Calculate average WER only for sentences that still have errors after ignoring patterns
-            # Build a set of indices for flagged sentences
-            flagged_indices = set()
-            for i, fs in enumerate(filtered_sentences):
-                if fs.get('status', 'ok') != 'ok':
-                    flagged_indices.add(i)
-
-            # Sum WER only for sentences that are still flagged
-            total_wer = sum(
-                sentences[i].get('metrics', {}).get('wer', 0)
-                for i in flagged_indices
-                if 'metrics' in sentences[i]
-            )
-            avg_wer = (total_wer / len(flagged_indices) * 100) if flagged_indices else 0
-
-            return {
-                'sentenceCount': len(sentences),
-                'sentenceFlagged': len(flagged_sentences),
-                'sentenceAvgWer': f"{avg_wer:.2f}%",
-                'paragraphCount': len(paragraphs),
-                'paragraphFlagged': 0,
-                'paragraphAvgWer': '0.00%'
-            }
+            if ignored is None:
+                ignored = self.load_ignored_errors()
+
+            # Reuse metrics while the file and the ignore list are unchanged
+            st = os.stat(hydrate_path)
+            cache_key = str(hydrate_path)
+            cached = HYDRATE_METRICS_CACHE.get(cache_key)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size and cached[2] == ignored:
+                return cached[3]
+
+            with HYDRATE_METRICS_LOCKS.setdefault(cache_key, threading.Lock()):
+                cached = HYDRATE_METRICS_CACHE.get(cache_key)
+                if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size and cached[2] == ignored:
+                    return cached[3]
+                metrics = self.compute_hydrate_metrics(hydrate_path, ignored)
+                HYDRATE_METRICS_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, ignored, metrics)
+                return metrics
         except Exception as e:
             print(f"Error extracting metrics from {hydrate_path}: {e}")
             return {
                 'sentenceCount': 0,
                 'sentenceFlagged': 0,
                 'sentenceAvgWer': 'N/A',
+                'sentenceAvgWerRaw': None,
                 'paragraphCount': 0,
                 'paragraphFlagged': 0,
-                'paragraphAvgWer': 'N/A'
+                'paragraphAvgWer': 'N/A',
+                'paragraphAvgWerRaw': None
             }
 
+    def compute_hydrate_metrics(self, hydrate_path, ignored):
+        """Read hydrate.json and summarize its sentences and paragraphs"""
+        if ijson is not None:
+            with open(hydrate_path, 'rb') as f:
+                # Stream sentences one at a time; the large 'words' array is never materialized
+                sentence_count, flagged_count, total_wer = self.summarize_sentences(
+                    ijson.items(f, 'sentences.item', use_float=True), ignored)
+                paragraph_count = self.count_hydrate_paragraphs(f)
+        else:
+            hydrate_data = load_json_file(hydrate_path)
+            sentence_count, flagged_count, total_wer = self.summarize_sentences(
+                hydrate_data.get('sentences', []), ignored)
+            paragraph_count = len(hydrate_data.get('paragraphs', []))
+
+        avg_wer = (total_wer / flagged_count * 100) if flagged_count else 0
+
+        return {
+            'sentenceCount': sentence_count,
+            'sentenceFlagged': flagged_count,
+            'sentenceAvgWer': f"{avg_wer:.2f}%",
+            'sentenceAvgWerRaw': avg_wer,
+            'paragraphCount': paragraph_count,
+            'paragraphFlagged': 0,
+            'paragraphAvgWer': '0.00%',
+            'paragraphAvgWerRaw': 0.0
+        }
+
+    @staticmethod
+    def count_hydrate_paragraphs(f):
+        """Count the paragraphs in an open hydrate file, tokenizing only the trailing "paragraphs" member when possible"""
+        # The hydrate writer emits paragraphs last, so '{' followed by the file from the final
+        # "paragraphs" key is a complete object; any other layout fails to parse and falls back
+        start = rfind_in_file(f, b'"paragraphs"')
+        if start != -1:
+            f.seek(start)
+            paragraphs = ijson.sendable_list()
+            parser = ijson.items_coro(paragraphs, 'paragraphs.item')
+            count = 0
+            try:
+                parser.send(b'{')
+                while True:
+                    chunk = f.read(HYDRATE_SCAN_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    parser.send(chunk)
+                    # Only the count is kept; parsed items are dropped chunk by chunk
+                    count += len(paragraphs)
+                    del paragraphs[:]
+                parser.close()
+                return count + len(paragraphs)
+            except ijson.JSONError:
+                pass
+        f.seek(0)
+        return sum(1 for _ in ijson.items(f, 'paragraphs.item'))
+
     def extract_report_metrics(self, report_path):
         """Extract summary metrics from a validation report"""
         try:
-            with open(report_path, 'r', encoding='utf-8-sig') as f:
-                content = f.read()
+            # Reuse metrics while the report file is unchanged
+            st = os.stat(report_path)
+            cache_key = str(report_path)
+            cached = REPORT_METRICS_CACHE.get(cache_key)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
 
             metrics = {
                 'sentenceCount': 0,
                 'sentenceFlagged': 0,
                 'sentenceAvgWer': '0.00%',
+                'sentenceAvgWerRaw': 0.0,
                 'paragraphCount': 0,
                 'paragraphFlagged': 0,
-                'paragraphAvgWer': '0.00%'
+                'paragraphAvgWer': '0.00%',
+                'paragraphAvgWerRaw': 0.0
             }
 
-            # Parse sentences line: "Sentences : 277 (Avg WER 2.48%, Max WER 100.00%, Flagged 18)"
-            sent_match = re.search(r'Sentences\s*:\s*(\d+)\s*\(Avg WER ([\d.]+)%.*Flagged (\d+)\)', content)
+            # Scan line by line: the summary lines sit in the header, and flagged paragraphs are
+            # counted in the "All paragraphs by WER:" section, which runs to the next sentinel or EOF
+            sent_match = None
+            para_match = None
+            flagged_paragraphs = 0
+            in_paragraph_section = False
+            with open(report_path, 'r', encoding='utf-8-sig', buffering=REPORT_READ_BUFFER_SIZE) as f:
+                for line in f:
+                    if REPORT_PARAGRAPH_SECTION in line:
+                        if in_paragraph_section:
+                            break
+                        in_paragraph_section = True
+                    elif in_paragraph_section:
+                        if 'Status' in line and REPORT_FLAGGED_PARAGRAPH_RE.search(line):
+                            flagged_paragraphs += 1
+                    elif sent_match is None or para_match is None:
+                        # "Sentences : 277 (Avg WER 2.48%, Max WER 100.00%, Flagged 18)" or
+                        # "Paragraphs: 72 (Avg WER 3.57%, Avg Coverage 99.89%)"; the first of each wins
+                        match = REPORT_SUMMARY_RE.search(line)
+                        if match is None:
+                            continue
+                        if match.lastgroup == 'sentences':
+                            if sent_match is None:
+                                sent_match = match.group(2, 3, 4)
+                        elif para_match is None:
+                            para_match = match.group(6, 7)
+
             if sent_match:
-                metrics['sentenceCount'] = int(sent_match.group(1))
-                metrics['sentenceAvgWer'] = sent_match.group(2) + '%'
-                metrics['sentenceFlagged'] = int(sent_match.group(3))
+                count, avg_wer, flagged = sent_match
+                metrics['sentenceCount'] = int(count)
+                metrics['sentenceAvgWer'] = avg_wer + '%'
+                metrics['sentenceAvgWerRaw'] = float(avg_wer)
+                metrics['sentenceFlagged'] = int(flagged)
 
-            # Parse paragraphs line: "Paragraphs: 72 (Avg WER 3.57%, Avg Coverage 99.89%)"
-            para_match = re.search(r'Paragraphs\s*:\s*(\d+)\s*\(Avg WER ([\d.]+)%', content)
             if para_match:
-                metrics['paragraphCount'] = int(para_match.group(1))
-                metrics['paragraphAvgWer'] = para_match.group(2) + '%'
+                count, avg_wer = para_match
+                metrics['paragraphCount'] = int(count)
+                metrics['paragraphAvgWer'] = avg_wer + '%'
+                metrics['paragraphAvgWerRaw'] = float(avg_wer)
 
-            # Count flagged paragraphs
-            para_section = content.split('All paragraphs by WER:')
-            if len(para_section) > 1:
-                flagged_paras = re.findall(r'#\d+ \| WER [\d.]+% \| Coverage [\d.]+% \| Status (attention|unreliable)', para_section[1])
-                metrics['paragraphFlagged'] = len(flagged_paras)
+            metrics['paragraphFlagged'] = flagged_paragraphs
 
+            REPORT_METRICS_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, metrics)
             return metrics
         except Exception as e:
             print(f"Error extracting metrics from {report_path}: {e}")
@@ -606,98 +1588,80 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
                 'sentenceCount': 0,
                 'sentenceFlagged': 0,
                 'sentenceAvgWer': 'N/A',
+                'sentenceAvgWerRaw': None,
                 'paragraphCount': 0,
                 'paragraphFlagged': 0,
-                'paragraphAvgWer': 'N/A'
+                'paragraphAvgWer': 'N/A',
+                'paragraphAvgWerRaw': None
+            }
+
+    @staticmethod
+    def natural_sort_key(name):
+        number_match = NUMBER_RE.search(name)
+        if number_match:
+            # Prefer the first number block (chapters typically lead with it);
+            # the secondary key ensures ties keep lexicographic order
+            return (0, int(number_match.group()), name.lower())
+        return (1, name.lower())
+
+    def list_chapters_with_metrics(self):
+        """Find all hydrate files and return naturally sorted chapters with metrics"""
+        candidates = list(self.iter_chapter_hydrate_paths())
+        if not candidates:
+            return []
+
+        # Extraction is file I/O plus JSON parsing, so cold chapters overlap well in threads
+        ignored = self.load_ignored_errors()
+        workers = min(METRICS_WORKERS, len(candidates))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            metrics_list = list(executor.map(
+                lambda candidate: self.extract_hydrate_metrics(candidate[1], ignored), candidates))
+
+        # Candidates already come in natural order
+        return [
+            {
+                'name': name,
+                'path': name,
+                'metrics': metrics
             }
+            for (name, _), metrics in zip(candidates, metrics_list)
+        ]
 
     def serve_chapters_list(self):
         """Find all hydrate files and return chapter list with metrics"""
-        chapters = []
-
-        for item in BASE_DIR.iterdir():
-            if item.is_dir():
-                # Look for hydrate.json in this directory
-                hydrate_pattern = item.name + ".align.hydrate.json"
-                hydrate_path = item / hydrate_pattern
-
-                if hydrate_path.exists():
-                    # Extract basic metrics from hydrate
-                    metrics = self.extract_hydrate_metrics(hydrate_path)
-                    chapters.append({
-                        'name': item.name,
-                        'path': str(item.relative_to(BASE_DIR)),
-                        'metrics': metrics
-                    })
-
-        def natural_sort_key(chapter):
-            name = chapter['name']
-            number_groups = [int(match.group()) for match in re.finditer(r"\d+", name)]
-            if number_groups:
-                # Prefer the first number block (chapters typically lead with it)
-                primary = number_groups[0]
-                # Secondary key ensures ties keep lexicographic order
-                return (0, primary, name.lower())
-            return (1, name.lower())
-
-        chapters.sort(key=natural_sort_key)
-
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(chapters).encode())
+        chapters = self.list_chapters_with_metrics()
+        if len(chapters) >= JSON_STREAM_MIN_ITEMS:
+            self.send_json_array_stream(b'', chapters, b'')
+        else:
+            self.send_json_response(chapters)
 
     def serve_overview(self):
         """Serve book-wide overview with aggregated metrics"""
-        chapters = []
-
-        for item in BASE_DIR.iterdir():
-            if item.is_dir():
-                hydrate_pattern = item.name + ".align.hydrate.json"
-                hydrate_path = item / hydrate_pattern
-
-                if hydrate_path.exists():
-                    metrics = self.extract_hydrate_metrics(hydrate_path)
-                    chapters.append({
-                        'name': item.name,
-                        'path': str(item.relative_to(BASE_DIR)),
-                        'metrics': metrics
-                    })
-
-        def natural_sort_key(chapter):
-            name = chapter['name']
-            number_groups = [int(match.group()) for match in re.finditer(r"\d+", name)]
-            if number_groups:
-                primary = number_groups[0]
-                return (0, primary, name.lower())
-            return (1, name.lower())
-
-        chapters.sort(key=natural_sort_key)
-
-        # Calculate book-wide totals
-        total_sentences = sum(c['metrics']['sentenceCount'] for c in chapters)
-        total_flagged_sentences = sum(c['metrics']['sentenceFlagged'] for c in chapters)
-        total_paragraphs = sum(c['metrics']['paragraphCount'] for c in chapters)
-        total_flagged_paragraphs = sum(c['metrics']['paragraphFlagged'] for c in chapters)
-
-        # Calculate weighted average WER
-        if total_sentences > 0:
-            weighted_sent_wer_sum = sum(
-                c['metrics']['sentenceCount'] * float(c['metrics']['sentenceAvgWer'].rstrip('%'))
-                for c in chapters if c['metrics']['sentenceAvgWer'] != 'N/A'
-            )
-            avg_sentence_wer = weighted_sent_wer_sum / total_sentences
-        else:
-            avg_sentence_wer = 0
-
-        if total_paragraphs > 0:
-            weighted_para_wer_sum = sum(
-                c['metrics']['paragraphCount'] * float(c['metrics']['paragraphAvgWer'].rstrip('%'))
-                for c in chapters if c['metrics']['paragraphAvgWer'] != 'N/A'
-            )
-            avg_paragraph_wer = weighted_para_wer_sum / total_paragraphs
-        else:
-            avg_paragraph_wer = 0
+        chapters = self.list_chapters_with_metrics()
+
+        # Calculate book-wide totals in one pass over the (cached, already numeric) chapter metrics.
+        # Weighted WER sums skip chapters whose extraction failed (raw value None)
+        total_sentences = 0
+        total_flagged_sentences = 0
+        total_paragraphs = 0
+        total_flagged_paragraphs = 0
+        weighted_sent_wer_sum = 0
+        weighted_para_wer_sum = 0
+        for chapter in chapters:
+            metrics = chapter['metrics']
+            sentence_count = metrics['sentenceCount']
+            paragraph_count = metrics['paragraphCount']
+            total_sentences += sentence_count
+            total_flagged_sentences += metrics['sentenceFlagged']
+            total_paragraphs += paragraph_count
+            total_flagged_paragraphs += metrics['paragraphFlagged']
+            if metrics['sentenceAvgWerRaw'] is not None:
+                weighted_sent_wer_sum += sentence_count * metrics['sentenceAvgWerRaw']
+            if metrics['paragraphAvgWerRaw'] is not None:
+                weighted_para_wer_sum += paragraph_count * metrics['paragraphAvgWerRaw']
+
+        avg_sentence_wer = weighted_sent_wer_sum / total_sentences if total_sentences > 0 else 0
+        avg_paragraph_wer = weighted_para_wer_sum / total_paragraphs if total_paragraphs > 0 else 0
 
         overview = {
             'bookName': BASE_DIR.name,
@@ -708,13 +1672,19 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
             'totalParagraphs': total_paragraphs,
             'totalFlaggedParagraphs': total_flagged_paragraphs,
             'avgParagraphWer': f"{avg_paragraph_wer:.2f}%",
-            'chapters': chapters
         }
 
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(overview).encode())
+        if len(chapters) >= JSON_STREAM_MIN_ITEMS:
+            # Splice the chapter array in as the object's last member
+            self.send_json_array_stream(dumps_json(overview)[:-1] + b',"chapters":', chapters, b'}')
+        else:
+            overview['chapters'] = chapters
+            payload = dumps_json(overview)
+            # Built from cached metrics, so the encoded body itself is the cheapest validator
+            etag = f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+            if self.send_not_modified(etag):
+                return
+            self.send_json_bytes(payload, etag=etag)
 
     def serve_report(self, chapter_name):
         """Parse and serve a validation report from hydrate.json"""
@@ -730,88 +1700,134 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
         print(f"Hydrate exists: {hydrate_file.exists()}")
 
         if not hydrate_file.exists():
-            error_msg = json.dumps({
+            self.send_json_response({
                 'error': 'Hydrate file not found',
                 'chapter': chapter_name,
                 'path': str(hydrate_file)
-            })
-            self.send_response(404)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(error_msg.encode())
+            }, 404)
             return
 
+        # Once a streamed response has sent its headers, errors can no longer be reported as a 500
+        streamed = False
         try:
-            # Load hydrate data
-            with open(hydrate_file, 'r', encoding='utf-8') as f:
-                hydrate_data = json.load(f)
-
+            st = os.stat(hydrate_file)
             ignored = self.load_ignored_errors()
-            report_data = self.parse_hydrate_to_report(hydrate_data, chapter_name, ignored)
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(report_data).encode())
+
+            # The payload depends only on the hydrate file and the ignore list, so their
+            # versions make a validator that is known before anything is parsed
+            etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}-{IGNORED_ERRORS_STATE["mtime_ns"] or 0:x}"'
+            if self.send_not_modified(etag):
+                return
+
+            # Repeat views of an unchanged chapter reuse the encoded payload
+            cache_key = str(hydrate_file)
+            with REPORT_PAYLOAD_LOCK:
+                cached = REPORT_PAYLOAD_CACHE.pop(cache_key, None)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size and cached[2] == ignored:
+                payload = cached[3]
+            else:
+                # Load hydrate data; the report was created when the hydrate file was written
+                created = datetime.fromtimestamp(st.st_mtime).isoformat()
+                hydrate_data = load_json_file(hydrate_file)
+                report_data = self.parse_hydrate_to_report(hydrate_data, chapter_name, ignored, created)
+                sentences = report_data['sentences']
+                if len(sentences) >= JSON_STREAM_MIN_ITEMS:
+                    # Long chapters start sending while later sentences are still being
+                    # encoded; the sentence array is spliced in as the object's last member
+                    head = {key: value for key, value in report_data.items() if key != 'sentences'}
+                    streamed = True
+                    payload = self.send_json_array_stream(
+                        dumps_json(head)[:-1] + b',"sentences":', sentences, b'}', keep=True, etag=etag)
+                else:
+                    payload = dumps_json(report_data)
+
+            # Re-insert as most recently used and evict the oldest entries
+            with REPORT_PAYLOAD_LOCK:
+                REPORT_PAYLOAD_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, ignored, payload)
+                while len(REPORT_PAYLOAD_CACHE) > REPORT_CACHE_SIZE:
+                    del REPORT_PAYLOAD_CACHE[next(iter(REPORT_PAYLOAD_CACHE))]
+
+            if not streamed:
+                self.send_json_bytes(payload, etag=etag)
         except Exception as e:
             import traceback
             print(f"Error parsing hydrate: {e}")
             print(traceback.format_exc())
 
-            error_msg = json.dumps({
+            if streamed:
+                # The chunked body is incomplete (or the client went away); drop the connection
+                # rather than writing a second status line into it
+                self.close_connection = True
+                return
+            self.send_json_response({
                 'error': str(e),
                 'traceback': traceback.format_exc()
-            })
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(error_msg.encode())
+            }, 500)
+
+    def build_ui_sentence(self, sent):
+        """Convert one (already filtered) hydrate sentence to the UI format"""
+        metrics = sent.get('metrics') or EMPTY_DICT
+        timing = sent.get('timing') or EMPTY_DICT
+        book_range = sent.get('bookRange') or EMPTY_DICT
+        script_range = sent.get('scriptRange') or EMPTY_DICT
+
+        start_sec = timing.get('startSec', 0)
+        end_sec = timing.get('endSec', 0)
+        book_start = book_range.get('start')
+        book_end = book_range.get('end')
+        book_text = sent.get('bookText', '')
+        wer = metrics.get('wer', 0)
+        diff = sent.get('diff', {})
+
+        return {
+            'id': sent.get('id'),
+            'wer': format_percent(wer),
+            # Numeric WER (percent) so the client can sort without parsing labels
+            'werRaw': wer * 100,
+            'cer': format_percent(metrics.get('cer', 0)),
+            'status': sent.get('status', 'ok'),
+            'bookRange': f"{book_range.get('start', 0)}-{book_range.get('end', 0)}",
+            'scriptRange': f"{script_range.get('start', 0)}-{script_range.get('end', 0)}",
+            'timing': f"{start_sec:.3f}s → {end_sec:.3f}s (Δ {timing.get('duration', 0):.3f}s)",
+            'bookText': book_text,
+            'scriptText': sent.get('scriptText', ''),
+            'excerpt': book_text[:100],
+            'diff': diff,  # Already filtered
+            # Pre-flattened so the client never falls back to re-aligning text
+            'wordOps': sent.get('wordOps') or self.word_ops_from_diff(diff),
+            'startTime': start_sec,
+            'endTime': end_sec,
+            'bookRangeStart': book_start,
+            'bookRangeEnd': book_end
+        }
 
-    def parse_hydrate_to_report(self, hydrate_data, chapter_name, ignored_patterns=None):
+    def parse_hydrate_to_report(self, hydrate_data, chapter_name, ignored_patterns=None, created=None):
         """Convert hydrate.json data to report format expected by the UI"""
         ignored_patterns = ignored_patterns or set()
         sentences = hydrate_data.get('sentences', [])
         paragraphs = hydrate_data.get('paragraphs', [])
 
-        # Apply ignores and calculate statistics
+        # Apply ignores and calculate statistics in one pass, keeping running totals
         filtered_sentences = []
+        flagged_count = 0
+        total_wer = 0
+        max_wer = 0
         for sent in sentences:
-            filtered_sent, _ = self.apply_ignore_to_sentence(sent, ignored_patterns)
-            filtered_sentences.append(filtered_sent)
-
-        flagged_sentences = [s for s in filtered_sentences if s.get('status', 'ok') != 'ok']
-        total_wer = sum(s.get('metrics', {}).get('wer', 0) for s in sentences if 'metrics' in s)
+            filtered = self.apply_ignore_to_sentence(sent, ignored_patterns)[0]
+            filtered_sentences.append(filtered)
+            if filtered.get('status', 'ok') != 'ok':
+                flagged_count += 1
+            metrics = sent.get('metrics')
+            if metrics is not None:
+                wer = metrics.get('wer', 0)
+                total_wer += wer
+                if wer > max_wer:
+                    max_wer = wer
         avg_wer = (total_wer / len(sentences) * 100) if sentences else 0
-        max_wer = max((s.get('metrics', {}).get('wer', 0) for s in sentences if 'metrics' in s), default=0) * 100
+        max_wer *= 100
 
         # Convert sentences to UI format
-        ui_sentences = []
-        for sent in filtered_sentences:
-            metrics = sent.get('metrics', {})
-            timing = sent.get('timing', {})
-            book_range = sent.get('bookRange', {})
-            script_range = sent.get('scriptRange', {})
-
-            wer = metrics.get('wer', 0) * 100
-            cer = metrics.get('cer', 0) * 100
-
-            ui_sent = {
-                'id': sent.get('id'),
-                'wer': f"{wer:.1f}%",
-                'cer': f"{cer:.1f}%",
-                'status': sent.get('status', 'ok'),
-                'bookRange': f"{book_range.get('start', 0)}-{book_range.get('end', 0)}",
-                'scriptRange': f"{script_range.get('start', 0)}-{script_range.get('end', 0)}",
-                'timing': f"{timing.get('startSec', 0):.3f}s → {timing.get('endSec', 0):.3f}s (Δ {timing.get('duration', 0):.3f}s)",
-                'bookText': sent.get('bookText', ''),
-                'scriptText': sent.get('scriptText', ''),
-                'excerpt': sent.get('bookText', '')[:100],
-                'diff': sent.get('diff', {}),  # Already filtered
-                'startTime': timing.get('startSec', 0),
-                'endTime': timing.get('endSec', 0),
-                'bookRangeStart': book_range.get('start'),
-                'bookRangeEnd': book_range.get('end')
-            }
-            ui_sentences.append(ui_sent)
+        ui_sentences = [self.build_ui_sentence(sent) for sent in filtered_sentences]
 
         # Don't sort here - let frontend decide ordering based on view type
         # ui_sentences are already in chronological order (ID order) from hydrate.json
@@ -822,12 +1838,12 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
             'audioPath': hydrate_data.get('audioPath', ''),
             'scriptPath': '',
             'bookIndex': '',
-            'created': datetime.now().isoformat(),
+            'created': created or datetime.now().isoformat(),
             'stats': {
                 'sentenceCount': str(len(sentences)),
                 'avgWer': f"{avg_wer:.2f}%",
                 'maxWer': f"{max_wer:.2f}%",
-                'flaggedCount': str(len(flagged_sentences)),
+                'flaggedCount': str(flagged_count),
                 'paragraphCount': str(len(paragraphs)),
                 'paragraphAvgWer': '0.00%',
                 'avgCoverage': '100.00%'
@@ -838,14 +1854,23 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
 
         return report_data
 
+    @staticmethod
+    def normalized_ranges(sentences, range_key):
+        """Return (sentence_id, start, end) for each sentence with a valid range, ordered so start <= end"""
+        ranges = []
+        for sent in sentences:
+            index_range = sent.get(range_key) or EMPTY_DICT
+            start = parse_index(index_range.get('start'))
+            end = parse_index(index_range.get('end'))
+            if start is None or end is None:
+                continue
+            if end < start:
+                start, end = end, start
+            ranges.append((sent['id'], start, end))
+        return ranges
+
     def parse_report(self, report_path, chapter_name, hydrate_data=None):
         """Parse validation report text file into structured data"""
-        with open(report_path, 'r', encoding='utf-8-sig') as f:
-            content = f.read()
-
-        lines = content.split('\n')
-
-        # Parse header
         report_data = {
             'chapterName': chapter_name,
             'audioPath': '',
@@ -857,242 +1882,192 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
             'paragraphs': []
         }
 
-        def parse_index_range(range_text):
-            if not range_text:
-                return None, None
-
-            match = re.search(r'(\d+)\s*-\s*(\d+)', range_text)
-            if match:
-                return int(match.group(1)), int(match.group(2))
-
-            match = re.search(r'(\d+)', range_text)
-            if match:
-                value = int(match.group(1))
-                return value, value
-
-            return None, None
-
-        # Extract metadata from header
-        for line in lines[:10]:
-            if line.startswith('Audio'):
-                report_data['audioPath'] = line.split(':', 1)[1].strip()
-            elif line.startswith('Script'):
-                report_data['scriptPath'] = line.split(':', 1)[1].strip()
-            elif line.startswith('Book Index'):
-                report_data['bookIndex'] = line.split(':', 1)[1].strip()
-            elif line.startswith('Created'):
-                report_data['created'] = line.split(':', 1)[1].strip()
-            elif line.startswith('Sentences'):
-                # Parse: "Sentences : 277 (Avg WER 2.30%, Max WER 100.00%, Flagged 19)"
-                match = re.search(r'(\d+)\s*\(Avg WER ([\d.]+)%, Max WER ([\d.]+)%, Flagged (\d+)\)', line)
-                if match:
-                    report_data['stats']['sentenceCount'] = match.group(1)
-                    report_data['stats']['avgWer'] = match.group(2) + '%'
-                    report_data['stats']['maxWer'] = match.group(3) + '%'
-                    report_data['stats']['flaggedCount'] = match.group(4)
-            elif line.startswith('Paragraphs'):
-                # Parse: "Paragraphs: 72 (Avg WER 3.53%, Avg Coverage 98.93%)"
-                match = re.search(r'(\d+)\s*\(Avg WER ([\d.]+)%, Avg Coverage ([\d.]+)%\)', line)
-                if match:
-                    report_data['stats']['paragraphCount'] = match.group(1)
-                    report_data['stats']['paragraphAvgWer'] = match.group(2) + '%'
-                    report_data['stats']['avgCoverage'] = match.group(3) + '%'
-
-        # Parse sentences section
+        # One pass over the file: header lines until the first section marker, then items.
+        # current_section is None in the header, else the report_data key items go to
         current_section = None
         current_item = None
+        items = None
+        fields = REPORT_HEADER_FIELDS
 
-        for i, line in enumerate(lines):
-            line = line.strip()
+        with open(report_path, 'r', encoding='utf-8-sig') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                first = line[0]
+
+                # Item headers: "#43 | WER 100.0% | CER 100.0% | Status unreliable" (sentences)
+                # and "#44 | WER 100.0% | Coverage 100.0% | Status unreliable" (paragraphs).
+                # Only lines starting with '#' can be one, so the regex never sees field lines
+                if first == '#':
+                    match = REPORT_ITEM_HEADER_RE.match(line) if current_section else None
+                    if not match:
+                        continue
 
-            if line == 'All sentences by WER:':
-                current_section = 'sentences'
-                continue
-            elif line == 'All paragraphs by WER:':
-                current_section = 'paragraphs'
-                continue
+                    item_id, wer, kind, value, status = match.groups()
+                    if current_section == 'sentences' and kind == 'CER':
+                        if current_item:
+                            items.append(current_item)
+                        current_item = {
+                            'id': int(item_id),
+                            'wer': wer,
+                            'cer': value,
+                            'status': status,
+                            'bookRange': '',
+                            'scriptRange': '',
+                            'timing': '',
+                            'bookText': '',
+                            'scriptText': '',
+                            'excerpt': '',
+                            'startTime': None,
+                            'endTime': None,
+                            'bookRangeStart': None,
+                            'bookRangeEnd': None
+                        }
+                    elif current_section == 'paragraphs' and kind == 'Coverage':
+                        if current_item:
+                            items.append(current_item)
+                        current_item = {
+                            'id': int(item_id),
+                            'wer': wer,
+                            'coverage': value,
+                            'status': status,
+                            'bookRange': '',
+                            'bookText': '',
+                            'bookRangeStart': None,
+                            'bookRangeEnd': None,
+                            'sentenceIds': [],
+                            'startTime': None,
+                            'endTime': None,
+                            'timing': ''
+                        }
+                    continue
+
+                if first == 'A':
+                    section = REPORT_SECTIONS.get(line)
+                    if section:
+                        # The open item belongs to the section that just ended
+                        if current_item:
+                            items.append(current_item)
+                            current_item = None
+                        current_section = section
+                        items = report_data[section]
+                        fields = REPORT_SENTENCE_FIELDS if section == 'sentences' else REPORT_PARAGRAPH_FIELDS
+                        continue
 
-            if current_section == 'sentences':
-                # Match sentence header: "  #43 | WER 100.0% | CER 100.0% | Status unreliable"
-                match = re.match(r'#(\d+)\s*\|\s*WER\s*([\d.]+)%\s*\|\s*CER\s*([\d.]+)%\s*\|\s*Status\s*(\w+)', line)
-                if match:
-                    if current_item:
-                        report_data['sentences'].append(current_item)
-
-                    current_item = {
-                        'id': int(match.group(1)),
-                        'wer': match.group(2) + '%',
-                        'cer': match.group(3) + '%',
-                        'status': match.group(4),
-                        'bookRange': '',
-                        'scriptRange': '',
-                        'timing': '',
-                        'bookText': '',
-                        'scriptText': '',
-                        'excerpt': '',
-                        'startTime': None,
-                        'endTime': None,
-                        'bookRangeStart': None,
-                        'bookRangeEnd': None
-                    }
-                elif current_item:
-                    if line.startswith('Book range:'):
-                        range_text = line.split(':', 1)[1].strip()
-                        current_item['bookRange'] = range_text
-                        start, end = parse_index_range(range_text)
-                        current_item['bookRangeStart'] = start
-                        current_item['bookRangeEnd'] = end
-                    elif line.startswith('Script range:'):
-                        current_item['scriptRange'] = line.split(':', 1)[1].strip()
-                    elif line.startswith('Timing:'):
-                        timing_str = line.split(':', 1)[1].strip()
-                        current_item['timing'] = timing_str
-                        # Parse timing: "870.530s → 871.050s (Δ 0.520s)"
-                        timing_match = re.search(r'([\d.]+)s\s*→\s*([\d.]+)s', timing_str)
-                        if timing_match:
-                            current_item['startTime'] = float(timing_match.group(1))
-                            current_item['endTime'] = float(timing_match.group(2))
-                    elif line.startswith('Book   :'):
-                        current_item['bookText'] = line.split(':', 1)[1].strip()
-                    elif line.startswith('Script :'):
-                        current_item['scriptText'] = line.split(':', 1)[1].strip()
-                    elif line.startswith('Excerpt:'):
-                        current_item['excerpt'] = line.split(':', 1)[1].strip()
-
-            elif current_section == 'paragraphs':
-                # Match paragraph header: "  #44 | WER 100.0% | Coverage 100.0% | Status unreliable"
-                match = re.match(r'#(\d+)\s*\|\s*WER\s*([\d.]+)%\s*\|\s*Coverage\s*([\d.]+)%\s*\|\s*Status\s*(\w+)', line)
-                if match:
-                    if current_item and 'coverage' in current_item:
-                        report_data['paragraphs'].append(current_item)
-
-                    current_item = {
-                        'id': int(match.group(1)),
-                        'wer': match.group(2) + '%',
-                        'coverage': match.group(3) + '%',
-                        'status': match.group(4),
-                        'bookRange': '',
-                        'bookText': '',
-                        'bookRangeStart': None,
-                        'bookRangeEnd': None,
-                        'sentenceIds': [],
-                        'startTime': None,
-                        'endTime': None,
-                        'timing': ''
-                    }
-                elif current_item and 'coverage' in current_item:
-                    if line.startswith('Book range:'):
-                        range_text = line.split(':', 1)[1].strip()
-                        current_item['bookRange'] = range_text
-                        start, end = parse_index_range(range_text)
-                        current_item['bookRangeStart'] = start
-                        current_item['bookRangeEnd'] = end
-                    elif line.startswith('Book   :'):
-                        current_item['bookText'] = line.split(':', 1)[1].strip()
+                # Header and item field lines alike: split once at the first ':' and
+                # dispatch on the label through the current section's table
+                target = current_item if current_section else report_data
+                if target is None:
+                    continue
+                label, sep, value = line.partition(':')
+                if sep:
+                    setter = fields.get(label.rstrip())
+                    if setter:
+                        setter(target, value.strip())
 
         # Add last item
         if current_item:
-            if current_section == 'sentences':
-                report_data['sentences'].append(current_item)
-            elif current_section == 'paragraphs' and 'coverage' in current_item:
-                report_data['paragraphs'].append(current_item)
+            items.append(current_item)
 
         # Map paragraphs to sentences for linking and audio timing
         # Use hydrate data if available to get complete sentence list with timing
         if hydrate_data and 'paragraphs' in hydrate_data and 'sentences' in hydrate_data:
-            # Create lookup for hydrate sentences by ID
-            hydrate_sentences = {s['id']: s for s in hydrate_data['sentences']}
+            # Sentence ID -> (startSec, endSec) for sentences with complete timing, flattened
+            # once so the paragraph pass does a single lookup per sentence
+            sentence_timings = {}
+            for sent in hydrate_data['sentences']:
+                timing = sent.get('timing')
+                if timing and 'startSec' in timing and 'endSec' in timing:
+                    sentence_timings[sent['id']] = (timing['startSec'], timing['endSec'])
             hydrate_paragraphs = {p['id']: p for p in hydrate_data['paragraphs']}
 
-            # Build a map from sentence ID to paragraph ID
-            sentence_to_paragraph = {}
-            for para in hydrate_data['paragraphs']:
-                for sent_id in para.get('sentenceIds', []):
-                    sentence_to_paragraph[sent_id] = para['id']
+            # Build a map from sentence ID to paragraph ID (later paragraphs win duplicates)
+            sentence_to_paragraph = {
+                sent_id: para['id']
+                for para in hydrate_data['paragraphs']
+                for sent_id in para.get('sentenceIds', ())
+            }
 
             # Build alignment word operations grouped by sentence, preserving order
-            word_ops_by_sentence = {}
+            word_ops_by_sentence = defaultdict(list)
             words = hydrate_data.get('words') or []
             if words:
-                def to_int(value):
-                    if isinstance(value, int):
-                        return value
-                    if isinstance(value, str):
-                        value = value.strip()
-                        if re.fullmatch(r'-?\d+', value):
-                            return int(value)
-                    return None
-
                 # Map each book word index to its sentence ID for quick lookup
-                book_to_sentence = {}
-                script_ranges = []
-                for sent in hydrate_data['sentences']:
-                    book_range = sent.get('bookRange') or {}
-                    start = to_int(book_range.get('start'))
-                    end = to_int(book_range.get('end'))
-                    if start is None or end is None:
-                        pass
-                    else:
-                        if end < start:
-                            start, end = end, start
-
-                        for idx in range(start, end + 1):
-                            book_to_sentence[idx] = sent['id']
-
-                    script_range = sent.get('scriptRange') or {}
-                    script_start = to_int(script_range.get('start'))
-                    script_end = to_int(script_range.get('end'))
-                    if script_start is not None and script_end is not None:
-                        if script_end < script_start:
-                            script_start, script_end = script_end, script_start
-                        script_ranges.append((sent['id'], script_start, script_end))
-
-                    word_ops_by_sentence.setdefault(sent['id'], [])
+                book_ranges = self.normalized_ranges(hydrate_data['sentences'], 'bookRange')
+                script_ranges = self.normalized_ranges(hydrate_data['sentences'], 'scriptRange')
+
+                # Dense lookup table offset by the smallest book index; each sentence
+                # fills its span with one slice assignment (later sentences win overlaps)
+                book_base = 0
+                book_last = -1
+                if book_ranges:
+                    _, book_base, book_last = book_ranges[0]
+                    for _, start, end in book_ranges:
+                        if start < book_base:
+                            book_base = start
+                        if end > book_last:
+                            book_last = end
+                book_to_sentence = [None] * (book_last - book_base + 1)
+                for sent_id, start, end in book_ranges:
+                    book_to_sentence[start - book_base:end - book_base + 1] = [sent_id] * (end - start + 1)
 
                 script_ranges.sort(key=lambda r: (r[1], r[2], r[0]))
 
+                # Flat arrays over the sorted script ranges: starts are ascending and the running
+                # max of ends is non-decreasing, so both can be bisected per word
+                script_ids = [sid for sid, _, _ in script_ranges]
+                script_starts = [start for _, start, _ in script_ranges]
+                script_max_ends = []
+                max_end = None
+                for _, _, end in script_ranges:
+                    if max_end is None or end > max_end:
+                        max_end = end
+                    script_max_ends.append(max_end)
+
                 def sentence_from_asr_idx(asr_idx):
+                    """First range (in sorted order) containing asr_idx, else the nearest one"""
                     if asr_idx is None or not script_ranges:
                         return None
 
-                    containing = [sid for sid, start, end in script_ranges if start <= asr_idx <= end]
-                    if containing:
-                        return containing[0]
-
-                    nearest_id = None
-                    nearest_distance = None
-                    for sid, start, end in script_ranges:
-                        if asr_idx < start:
-                            distance = start - asr_idx
-                        else:
-                            distance = asr_idx - end
-
-                        if nearest_distance is None or distance < nearest_distance:
-                            nearest_distance = distance
-                            nearest_id = sid
-
-                    return nearest_id
+                    # Ranges [0, after) start at or before asr_idx; the first of them whose end
+                    # reaches asr_idx is where the running max first gets there
+                    after = bisect_right(script_starts, asr_idx)
+                    first_reaching = bisect_left(script_max_ends, asr_idx)
+                    if first_reaching < after:
+                        return script_ids[first_reaching]
+
+                    # No containing range: the nearest is either the earliest range with the
+                    # largest end before asr_idx or the first range starting after it (ties go
+                    # to the earlier range in sorted order, i.e. the left one)
+                    if after == 0:
+                        return script_ids[0]
+                    left_end = script_max_ends[after - 1]
+                    left = bisect_left(script_max_ends, left_end)
+                    if after < len(script_starts) and script_starts[after] - asr_idx < asr_idx - left_end:
+                        return script_ids[after]
+                    return script_ids[left]
 
                 for word in words:
+                    get = word.get
                     sentence_id = None
-                    book_idx = to_int(word.get('bookIdx'))
-                    asr_idx = to_int(word.get('asrIdx'))
-                    if book_idx is not None:
-                        sentence_id = book_to_sentence.get(book_idx)
+                    book_idx = parse_index(get('bookIdx'))
+                    asr_idx = parse_index(get('asrIdx'))
+                    if book_idx is not None and 0 <= book_idx - book_base < len(book_to_sentence):
+                        sentence_id = book_to_sentence[book_idx - book_base]
                     if sentence_id is None:
                         sentence_id = sentence_from_asr_idx(asr_idx)
                     if sentence_id is None:
                         continue
 
-                    entry = {
-                        'op': word.get('op'),
-                        'reason': word.get('reason'),
-                        'bookWord': (word.get('bookWord') or '').strip(),
-                        'asrWord': (word.get('asrWord') or '').strip(),
-                        'bookIdx': book_idx,
-                        'asrIdx': asr_idx
-                    }
-                    word_ops_by_sentence.setdefault(sentence_id, []).append(entry)
+                    word_ops_by_sentence[sentence_id].append(WordOp(
+                        get('op'),
+                        get('reason'),
+                        (get('bookWord') or '').strip(),
+                        (get('asrWord') or '').strip(),
+                        book_idx,
+                        asr_idx
+                    ))
 
             # Add paragraph ID to each sentence
             for sentence in report_data['sentences']:
@@ -1102,53 +2077,56 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
                     if ops:
                         sentence['wordOps'] = ops
 
+            # Flagged sentences are the ones listed in the report; the set is shared by all paragraphs
+            flagged_ids = frozenset(s['id'] for s in report_data['sentences'])
+
             for paragraph in report_data['paragraphs']:
                 para_id = paragraph.get('id')
                 hydrate_para = hydrate_paragraphs.get(para_id)
+                all_sentence_ids = hydrate_para.get('sentenceIds') if hydrate_para else None
 
-                if hydrate_para and 'sentenceIds' in hydrate_para:
+                if all_sentence_ids is not None:
                     # Get ALL sentence IDs from hydrate (not just flagged ones)
-                    all_sentence_ids = hydrate_para['sentenceIds']
                     paragraph['sentenceIds'] = all_sentence_ids
 
-                    # Find which of these sentences are flagged (in report_data['sentences'])
-                    flagged_ids = {s['id'] for s in report_data['sentences']}
-                    paragraph['flaggedSentenceIds'] = [sid for sid in all_sentence_ids if sid in flagged_ids]
+                    # Find which of these sentences are flagged (in report_data['sentences']).
+                    # Most paragraphs have none, which isdisjoint settles in C without building a list
+                    if flagged_ids.isdisjoint(all_sentence_ids):
+                        paragraph['flaggedSentenceIds'] = []
+                    else:
+                        paragraph['flaggedSentenceIds'] = [sid for sid in all_sentence_ids if sid in flagged_ids]
 
                     # Calculate timing from ALL sentences in paragraph
-                    # Also include last sentence of previous paragraph and first sentence of next paragraph
-                    context_sentence_ids = all_sentence_ids.copy()
+                    # Also include last sentence of previous paragraph and first sentence of next paragraph.
+                    # Only the earliest start and latest end are kept, so the neighbours are simply
+                    # walked after the paragraph's own IDs: no list copy, insert(0) or membership scan
+                    neighbour_sentence_ids = []
 
                     # Add last sentence from previous paragraph (by ID, not by sorted position)
                     prev_para_id = para_id - 1
                     if prev_para_id >= 0:
                         prev_hydrate = hydrate_paragraphs.get(prev_para_id)
-                        if prev_hydrate and 'sentenceIds' in prev_hydrate and prev_hydrate['sentenceIds']:
-                            last_prev_sent_id = prev_hydrate['sentenceIds'][-1]
-                            if last_prev_sent_id not in context_sentence_ids:
-                                context_sentence_ids.insert(0, last_prev_sent_id)
+                        if prev_hydrate and prev_hydrate.get('sentenceIds'):
+                            neighbour_sentence_ids.append(prev_hydrate['sentenceIds'][-1])
 
                     # Add first sentence from next paragraph (by ID, not by sorted position)
-                    next_para_id = para_id + 1
-                    next_hydrate = hydrate_paragraphs.get(next_para_id)
-                    if next_hydrate and 'sentenceIds' in next_hydrate and next_hydrate['sentenceIds']:
-                        first_next_sent_id = next_hydrate['sentenceIds'][0]
-                        if first_next_sent_id not in context_sentence_ids:
-                            context_sentence_ids.append(first_next_sent_id)
-
-                    start_times = []
-                    end_times = []
-                    for sent_id in context_sentence_ids:
-                        hydrate_sent = hydrate_sentences.get(sent_id)
-                        if hydrate_sent and 'timing' in hydrate_sent:
-                            timing = hydrate_sent['timing']
-                            if 'startSec' in timing and 'endSec' in timing:
-                                start_times.append(timing['startSec'])
-                                end_times.append(timing['endSec'])
-
-                    if start_times and end_times:
-                        paragraph_start = min(start_times)
-                        paragraph_end = max(end_times)
+                    next_hydrate = hydrate_paragraphs.get(para_id + 1)
+                    if next_hydrate and next_hydrate.get('sentenceIds'):
+                        neighbour_sentence_ids.append(next_hydrate['sentenceIds'][0])
+
+                    # Track the earliest start and latest end directly instead of collecting lists
+                    paragraph_start = None
+                    paragraph_end = None
+                    for sent_id in chain(all_sentence_ids, neighbour_sentence_ids):
+                        sent_timing = sentence_timings.get(sent_id)
+                        if sent_timing:
+                            sent_start, sent_end = sent_timing
+                            if paragraph_start is None or sent_start < paragraph_start:
+                                paragraph_start = sent_start
+                            if paragraph_end is None or sent_end > paragraph_end:
+                                paragraph_end = sent_end
+
+                    if paragraph_start is not None:
                         paragraph['startTime'] = paragraph_start
                         paragraph['endTime'] = paragraph_end
                         duration = paragraph_end - paragraph_start
@@ -1165,7 +2143,26 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
                     paragraph['endTime'] = None
                     paragraph['timing'] = ''
         else:
-            # Original fallback logic using only flagged sentences
+            # Original fallback logic using only flagged sentences.
+            # Sentences are sorted by book start once and flattened into parallel arrays; a
+            # running max of their end indices lets each paragraph bisect straight to the
+            # first sentence that can overlap it, then walk by index without slicing.
+            ranged_sentences = sorted(
+                (s for s in report_data['sentences']
+                 if s.get('bookRangeStart') is not None and s.get('bookRangeEnd') is not None),
+                key=itemgetter('bookRangeStart'))
+            sentence_starts = [s['bookRangeStart'] for s in ranged_sentences]
+            sentence_ends = [s['bookRangeEnd'] for s in ranged_sentences]
+            sentence_ids_sorted = [s['id'] for s in ranged_sentences]
+            sentence_start_times = [s.get('startTime') for s in ranged_sentences]
+            sentence_end_times = [s.get('endTime') for s in ranged_sentences]
+            max_sentence_ends = []
+            max_end = None
+            for sentence_end in sentence_ends:
+                if max_end is None or sentence_end > max_end:
+                    max_end = sentence_end
+                max_sentence_ends.append(max_end)
+
             for paragraph in report_data['paragraphs']:
                 start = paragraph.get('bookRangeStart')
                 end = paragraph.get('bookRangeEnd')
@@ -1178,31 +2175,28 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
                     continue
 
                 sentence_ids = []
-                start_times = []
-                end_times = []
-
-                for sentence in report_data['sentences']:
-                    sentence_start = sentence.get('bookRangeStart')
-                    sentence_end = sentence.get('bookRangeEnd')
-                    if sentence_start is None or sentence_end is None:
-                        continue
+                paragraph_start = None
+                paragraph_end = None
 
-                    if sentence_end < start or sentence_start > end:
+                first = bisect_left(max_sentence_ends, start)
+                last = bisect_right(sentence_starts, end)
+                for k in range(first, last):
+                    if sentence_ends[k] < start:
                         continue
 
-                    sentence_ids.append(sentence['id'])
-                    if sentence.get('startTime') is not None:
-                        start_times.append(sentence['startTime'])
-                    if sentence.get('endTime') is not None:
-                        end_times.append(sentence['endTime'])
+                    sentence_ids.append(sentence_ids_sorted[k])
+                    sent_start = sentence_start_times[k]
+                    sent_end = sentence_end_times[k]
+                    if sent_start is not None and (paragraph_start is None or sent_start < paragraph_start):
+                        paragraph_start = sent_start
+                    if sent_end is not None and (paragraph_end is None or sent_end > paragraph_end):
+                        paragraph_end = sent_end
 
                 sentence_ids.sort()
                 paragraph['sentenceIds'] = sentence_ids
                 paragraph['flaggedSentenceIds'] = sentence_ids  # All are flagged in fallback mode
 
-                if start_times and end_times:
-                    paragraph_start = min(start_times)
-                    paragraph_end = max(end_times)
+                if paragraph_start is not None and paragraph_end is not None:
                     if paragraph_end < paragraph_start:
                         paragraph_end = paragraph_start
                     paragraph['startTime'] = paragraph_start
@@ -1219,8 +2213,6 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
     def serve_audio_segment(self, chapter_name, query_string):
         """Serve an audio segment for a specific chapter and time range"""
         from urllib.parse import unquote, parse_qs
-        import subprocess
-        import tempfile
 
         # Parse chapter name and query parameters
         chapter_name = unquote(chapter_name)
@@ -1231,98 +2223,296 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
         source = query_params.get('source', ['raw'])[0] if 'source' in query_params else 'raw'
 
         # Find the audio file based on source
-        if source == 'treated':
-            audio_path = BASE_DIR / chapter_name / f"{chapter_name}.treated.wav"
-        elif source == 'filtered':
-            audio_path = BASE_DIR / chapter_name / f"{chapter_name}.filtered.wav"
-        else:  # raw
-            # Try chapter folder first, then book root
-            audio_path = BASE_DIR / chapter_name / f"{chapter_name}.wav"
-            if not audio_path.exists():
-                audio_path = BASE_DIR / f"{chapter_name}.wav"
+        audio_path, audio_found = self.find_chapter_audio(chapter_name, source)
 
         print(f"Looking for audio: {audio_path}")
-        print(f"Audio exists: {audio_path.exists()}")
+        print(f"Audio exists: {audio_found}")
         print(f"Segment: {start_time}s to {end_time}s")
 
-        if not audio_path.exists():
-            error_msg = json.dumps({
+        if not audio_found:
+            self.send_json_response({
                 'error': 'Audio file not found',
                 'path': str(audio_path)
-            })
-            self.send_response(404)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(error_msg.encode())
+            }, 404)
             return
 
         try:
+            # Every variant below is derived from the source file and the requested span, so
+            # a replayed sentence is revalidated instead of being cut and sent again
+            st = os.stat(audio_path)
+            etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}-{start_time}-{end_time}"'
+            if self.send_not_modified(etag):
+                return
+
             # If no segment specified, serve the whole file
             if start_time is None or end_time is None:
-                with open(audio_path, 'rb') as f:
-                    audio_data = f.read()
-
-                self.send_response(200)
-                self.send_header('Content-type', 'audio/wav')
-                self.send_header('Content-Length', str(len(audio_data)))
-                self.send_header('Accept-Ranges', 'bytes')
-                self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate')
-                self.send_header('Pragma', 'no-cache')
-                self.send_header('Expires', '0')
-                self.end_headers()
-                self.wfile.write(audio_data)
+                self.send_audio(audio_path, 0, st.st_size, etag=etag)
                 return
 
-            # Use ffmpeg to extract the audio segment
             duration = end_time - start_time
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                temp_path = temp_file.name
 
-            # Extract segment using ffmpeg
-            cmd = [
-                'ffmpeg',
-                '-i', str(audio_path),
-                '-ss', str(start_time),
-                '-t', str(duration),
-                '-c', 'copy',
-                '-y',
-                temp_path
-            ]
+            # Uncompressed WAV: cut the sample range directly instead of spawning ffmpeg
+            segment = wav_segment(audio_path, start_time, duration)
+            if segment is not None:
+                riff_header, offset, size = segment
+                self.send_audio(audio_path, offset, size, riff_header, etag)
+                return
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            if self.headers.get('Range'):
+                # The player issues a series of Range requests while seeking, so the ffmpeg cut
+                # is kept on disk and each range is sent from it
+                segment_path = self.cached_audio_segment(audio_path, start_time, duration)
+            else:
+                # Without a Range request ffmpeg's output is relayed as it is produced (no temp
+                # file), unless an earlier seek already left this cut on disk
+                segment_path = self.cached_audio_segment(audio_path, start_time, duration, cut=False)
+                if segment_path is None:
+                    self.stream_audio_segment(audio_path, start_time, duration, etag)
+                    return
+            self.send_audio(segment_path, 0, os.path.getsize(segment_path), etag=etag)
 
-            if result.returncode != 0:
-                raise Exception(f"ffmpeg failed: {result.stderr}")
+        except Exception as e:
+            import traceback
+            print(f"Error serving audio: {e}")
+            print(traceback.format_exc())
 
-            # Serve the file
-            with open(temp_path, 'rb') as f:
-                audio_data = f.read()
+            self.send_json_response({
+                'error': str(e),
+                'traceback': traceback.format_exc()
+            }, 500)
+
+    def stream_audio_segment(self, audio_path, start_time, duration, etag=None):
+        """Stream an ffmpeg-cut segment of audio_path using chunked transfer encoding"""
+        cmd = [
+            'ffmpeg',
+            '-nostdin',
+            '-loglevel', 'error',
+            '-ss', str(start_time),
+            '-t', str(duration),
+            '-i', str(audio_path),
+            '-c', 'copy',
+            '-f', 'wav',
+            '-'
+        ]
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            chunk = proc.stdout.read1(AUDIO_STREAM_CHUNK_SIZE)
+            if not chunk:
+                # Nothing was produced, so a normal error response can still be sent
+                _, stderr = proc.communicate()
+                raise Exception(f"ffmpeg failed: {stderr.decode('utf-8', 'replace')}")
 
             self.send_response(200)
             self.send_header('Content-type', 'audio/wav')
-            self.send_header('Content-Length', str(len(audio_data)))
-            self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate')
-            self.send_header('Pragma', 'no-cache')
-            self.send_header('Expires', '0')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.send_audio_cache_headers(etag)
             self.end_headers()
-            self.wfile.write(audio_data)
+            try:
+                while chunk:
+                    self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+                    chunk = proc.stdout.read1(AUDIO_STREAM_CHUNK_SIZE)
+                stderr = proc.stderr.read()
+                if proc.wait() != 0:
+                    # ffmpeg died partway: leave the transfer unterminated so the player sees a
+                    # broken response instead of caching a truncated WAV under the ETag
+                    print(f"ffmpeg failed mid-stream: {stderr.decode('utf-8', 'replace')}")
+                    self.close_connection = True
+                    return
+                self.wfile.write(b'0\r\n\r\n')
+            except OSError:
+                # The player went away (e.g. the user scrubbed elsewhere)
+                self.close_connection = True
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.communicate()
 
-            # Clean up temp file
-            os.unlink(temp_path)
+    @staticmethod
+    def find_chapter_audio(chapter_name, source='raw'):
+        """Return (path, found) for a chapter's audio file as a plain string path.
+
+        source is 'treated', 'filtered', 'raw' (chapter folder, then book root) or
+        'preferred' (treated, then raw). When nothing exists the last candidate is returned.
+        """
+        base = str(BASE_DIR)
+        chapter_dir = os.path.join(base, chapter_name)
+        raw_candidates = (
+            os.path.join(chapter_dir, f"{chapter_name}.wav"),
+            os.path.join(base, f"{chapter_name}.wav")
+        )
+        if source == 'treated':
+            candidates = (os.path.join(chapter_dir, f"{chapter_name}.treated.wav"),)
+        elif source == 'filtered':
+            candidates = (os.path.join(chapter_dir, f"{chapter_name}.filtered.wav"),)
+        elif source == 'preferred':
+            candidates = (os.path.join(chapter_dir, f"{chapter_name}.treated.wav"),) + raw_candidates
+        else:  # raw
+            candidates = raw_candidates
 
-        except Exception as e:
-            import traceback
-            print(f"Error serving audio: {e}")
-            print(traceback.format_exc())
+        for path in candidates:
+            if os.path.isfile(path):
+                return path, True
+        return candidates[-1], False
 
-            error_msg = json.dumps({
-                'error': str(e),
-                'traceback': traceback.format_exc()
-            })
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
+    @staticmethod
+    def parse_byte_range(range_header, total):
+        """Return (first, last) for a single 'bytes=' Range header, None to send everything, or False if unsatisfiable"""
+        match = BYTE_RANGE_RE.fullmatch(range_header.strip()) if range_header else None
+        if not match or not (match.group(1) or match.group(2)):
+            # Absent, malformed or multi-range requests get the full body
+            return None
+        if not match.group(1):
+            # Suffix range: the last N bytes
+            suffix = int(match.group(2))
+            if suffix == 0:
+                return False
+            return max(total - suffix, 0), total - 1
+        first = int(match.group(1))
+        last = int(match.group(2)) if match.group(2) else total - 1
+        if last < first:
+            # Invalid range spec; ignored per RFC 7233
+            return None
+        if first >= total:
+            return False
+        return first, min(last, total - 1)
+
+    def send_audio(self, audio_path, offset, size, prefix=b'', etag=None):
+        """Stream prefix + size bytes of audio_path from offset as audio/wav, honouring a Range request"""
+        total = len(prefix) + size
+        byte_range = self.parse_byte_range(self.headers.get('Range'), total)
+        if byte_range is False:
+            self.send_response(416)
+            self.send_header('Content-Range', f'bytes */{total}')
+            self.send_header('Content-Length', '0')
             self.end_headers()
-            self.wfile.write(error_msg.encode())
+            return
+
+        first, last = byte_range or (0, total - 1)
+        self.send_response(206 if byte_range else 200)
+        self.send_header('Content-type', 'audio/wav')
+        self.send_header('Content-Length', str(last - first + 1))
+        if byte_range:
+            self.send_header('Content-Range', f'bytes {first}-{last}/{total}')
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_audio_cache_headers(etag)
+        self.end_headers()
+
+        # The body is the (synthesized) prefix followed by the file slice
+        if first < len(prefix):
+            self.wfile.write(prefix[first:last + 1])
+        file_first = max(first - len(prefix), 0)
+        file_last = last - len(prefix)
+        if file_last >= file_first:
+            with open(audio_path, 'rb') as f:
+                # os.sendfile where the platform has it (kernel copy), plain sends otherwise
+                self.connection.sendfile(f, offset + file_first, file_last - file_first + 1)
+
+    @staticmethod
+    def next_crx_error_number(crx_dir):
+        """Return one past the highest numbered audio file (e.g. 001.wav) in the CRX folder"""
+        # The workbook is saved into this folder too, so its mtime cannot tell whether audio
+        # files were added; the cached number is trusted while the next name is still free
+        cached = CRX_ERROR_NUMBER_CACHE.get(str(crx_dir))
+        if cached is not None and not os.path.exists(os.path.join(crx_dir, f"{cached + 1:03d}.wav")):
+            return cached + 1
+
+        # Only the names are needed, so plain DirEntry names are filtered with str checks
+        # (no Path objects, fnmatch or per-entry stat) and the max runs in C
+        with os.scandir(crx_dir) as entries:
+            stems = [entry.name[:-4] for entry in entries if entry.name.endswith('.wav')]
+        highest = max((int(stem) for stem in stems if stem.isdecimal()), default=0)
+        CRX_ERROR_NUMBER_CACHE[str(crx_dir)] = highest
+        return highest + 1
+
+    @staticmethod
+    def record_crx_error_number(crx_dir, error_num):
+        """Note that error_num's audio file was just written, so the next lookup skips the scan"""
+        cache_key = str(crx_dir)
+        CRX_ERROR_NUMBER_CACHE[cache_key] = max(CRX_ERROR_NUMBER_CACHE.get(cache_key, 0), error_num)
+
+    @staticmethod
+    def cached_audio_segment(audio_path, start_time, duration, cut=True):
+        """Return the path of a temp WAV holding an ffmpeg cut of the segment, reusing earlier cuts.
+        With cut=False a miss returns None instead of running ffmpeg"""
+        st = os.stat(audio_path)
+        key = (str(audio_path), st.st_mtime_ns, st.st_size, start_time, duration)
+        evicted = []
+        with AUDIO_SEGMENT_LOCK:
+            segment_path = AUDIO_SEGMENT_CACHE.pop(key, None)
+            if segment_path is not None:
+                # Re-insert as most recently used
+                AUDIO_SEGMENT_CACHE[key] = segment_path
+                return segment_path
+            if not cut:
+                # A lookup only; per-key locks live as long as a cache entry, so none is made here
+                return None
+            segment_lock = AUDIO_SEGMENT_LOCKS.setdefault(key, threading.Lock())
+
+        with segment_lock:
+            with AUDIO_SEGMENT_LOCK:
+                # A concurrent request for the same segment may have cut it while this one waited
+                segment_path = AUDIO_SEGMENT_CACHE.get(key)
+                if segment_path is not None:
+                    return segment_path
+
+            fd, segment_path = tempfile.mkstemp(prefix='ams-segment-', suffix='.wav')
+            os.close(fd)
+            error = ValidationReportHandler.extract_audio_segment(audio_path, start_time, duration, segment_path)
+            if error is not None:
+                os.unlink(segment_path)
+                with AUDIO_SEGMENT_LOCK:
+                    # Nothing was cached, so the key's lock would otherwise never be evicted
+                    if key not in AUDIO_SEGMENT_CACHE:
+                        AUDIO_SEGMENT_LOCKS.pop(key, None)
+                raise Exception(f"ffmpeg failed: {error}")
+
+            with AUDIO_SEGMENT_LOCK:
+                # A request that raced an eviction of this key's lock may have cut it too
+                previous = AUDIO_SEGMENT_CACHE.pop(key, None)
+                if previous is not None:
+                    evicted.append(previous)
+                AUDIO_SEGMENT_CACHE[key] = segment_path
+                while len(AUDIO_SEGMENT_CACHE) > AUDIO_SEGMENT_CACHE_SIZE:
+                    oldest = next(iter(AUDIO_SEGMENT_CACHE))
+                    evicted.append(AUDIO_SEGMENT_CACHE.pop(oldest))
+                    AUDIO_SEGMENT_LOCKS.pop(oldest, None)
+
+        for old_path in evicted:
+            try:
+                os.unlink(old_path)
+            except OSError:
+                # Still being sent on another thread (Windows); removed at exit instead
+                pass
+        return segment_path
+
+    @staticmethod
+    def extract_audio_segment(audio_path, start_time, duration, output_path):
+        """Write a segment of audio_path to output_path; returns ffmpeg's stderr on failure"""
+        segment = wav_segment(audio_path, start_time, duration)
+        if segment is not None:
+            riff_header, offset, size = segment
+            with open(output_path, 'wb') as out:
+                out.write(riff_header)
+                copy_file_slice(audio_path, offset, size, out)
+            return None
+
+        # -ss/-t before -i seek the input directly instead of decoding up to start_time
+        cmd = [
+            'ffmpeg',
+            '-nostdin',
+            '-loglevel', 'error',
+            '-ss', str(start_time),
+            '-t', str(duration),
+            '-i', str(audio_path),
+            '-c', 'copy',
+            '-y',
+            str(output_path)
+        ]
+        # stdout is never used; stderr stays bytes and is only decoded on failure
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            return result.stderr.decode('utf-8', 'replace')
+        return None
 
     def handle_export_audio(self, chapter_name):
         """Export audio segment to CRX folder"""
@@ -1334,23 +2524,19 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
         # Read POST data
         content_length = int(self.headers['Content-Length'])
         post_data = self.rfile.read(content_length)
-        params = json.loads(post_data.decode('utf-8'))
+        params = loads_json(post_data)
 
         start_time = float(params['start'])
         end_time = float(params['end'])
         sentence_id = params.get('sentenceId', 'unknown')
 
         # Find the audio file - try chapter folder first, then book root
-        audio_path = BASE_DIR / chapter_name / f"{chapter_name}.treated.wav"
-        if not audio_path.exists():
-            audio_path = BASE_DIR / chapter_name / f"{chapter_name}.wav"
-        if not audio_path.exists():
-            audio_path = BASE_DIR / f"{chapter_name}.wav"
+        audio_path, audio_found = self.find_chapter_audio(chapter_name, 'preferred')
 
         print(f"Looking for audio at: {audio_path}")
-        print(f"Audio exists: {audio_path.exists()}")
+        print(f"Audio exists: {audio_found}")
 
-        if not audio_path.exists():
+        if not audio_found:
             self.send_json_response({'error': 'Audio file not found'}, 404)
             return
 
@@ -1360,43 +2546,18 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
             crx_dir.mkdir(exist_ok=True)
 
             # Determine the next error number by checking existing audio files
-            # Find the highest numbered .wav file in the CRX directory
-            existing_files = list(crx_dir.glob('*.wav'))
-            if existing_files:
-                # Extract numbers from filenames like "001.wav", "002.wav"
-                error_numbers = []
-                for f in existing_files:
-                    match = re.match(r'(\d+)\.wav', f.name)
-                    if match:
-                        error_numbers.append(int(match.group(1)))
-
-                if error_numbers:
-                    error_num = max(error_numbers) + 1
-                else:
-                    error_num = 1
-            else:
-                error_num = 1
+            error_num = self.next_crx_error_number(crx_dir)
 
             # Generate filename: ErrorNum.wav (e.g., 001.wav)
             export_filename = f"{error_num:03d}.wav"
             export_path = crx_dir / export_filename
 
-            # Extract segment using ffmpeg
+            # Extract segment
             duration = end_time - start_time
-            cmd = [
-                'ffmpeg',
-                '-i', str(audio_path),
-                '-ss', str(start_time),
-                '-t', str(duration),
-                '-c', 'copy',
-                '-y',
-                str(export_path)
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.returncode != 0:
-                raise Exception(f"ffmpeg failed: {result.stderr}")
+            error = self.extract_audio_segment(audio_path, start_time, duration, export_path)
+            if error is not None:
+                raise Exception(f"ffmpeg failed: {error}")
+            self.record_crx_error_number(crx_dir, error_num)
 
             self.send_json_response({
                 'success': True,
@@ -1419,7 +2580,7 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
         # Read POST data
         content_length = int(self.headers['Content-Length'])
         post_data = self.rfile.read(content_length)
-        params = json.loads(post_data.decode('utf-8'))
+        params = loads_json(post_data)
 
         start_time = float(params['start'])
         end_time = float(params['end'])
@@ -1438,27 +2599,16 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
             crx_path = crx_dir / crx_filename
 
             # Determine next error number by checking existing audio files
-            existing_files = list(crx_dir.glob('*.wav'))
-            if existing_files:
-                error_numbers = []
-                for f in existing_files:
-                    match = re.match(r'(\d+)\.wav', f.name)
-                    if match:
-                        error_numbers.append(int(match.group(1)))
-                error_num = max(error_numbers) + 1 if error_numbers else 1
-            else:
-                error_num = 1
-
-            # If CRX doesn't exist, copy BASE_CRX template
-            if not crx_path.exists():
-                if not CRX_TEMPLATE_PATH.exists():
-                    raise Exception(f"CRX template not found: {CRX_TEMPLATE_PATH}")
-                # Use shutil.copy2 to preserve metadata and formatting
-                shutil.copy2(CRX_TEMPLATE_PATH, crx_path)
+            error_num = self.next_crx_error_number(crx_dir)
 
-            # Use openpyxl to modify cells
-            wb = openpyxl.load_workbook(crx_path)
-            ws = wb.active
+            # If CRX doesn't exist, create it from the BASE_CRX template
+            if str(crx_path) not in CRX_INITIALIZED:
+                if not crx_path.exists():
+                    if not CRX_TEMPLATE_PATH.exists():
+                        raise Exception(f"CRX template not found: {CRX_TEMPLATE_PATH}")
+                    with CRX_WORKBOOK_LOCK:
+                        create_crx_workbook(crx_path, CRX_TEMPLATE_PATH)
+                CRX_INITIALIZED.add(str(crx_path))
 
             # Find the row corresponding to this error number
             # Row number = CRX_DATA_ROW_START + (error_num - 1)
@@ -1470,53 +2620,47 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
             seconds = int(start_time % 60)
             timecode = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
-            # Ensure Error # is populated in this row (Column B = 2)
-            current_error = ws.cell(row=target_row, column=2).value
-            if not current_error or not re.search(r'(\d+)', str(current_error)):
-                ws.cell(row=target_row, column=2).value = f"{error_num:03d}"
-
-            # Write data to cells
-            # Column C: Recording Day (leave empty)
-            # Column D: Chapter/Section
-            ws.cell(row=target_row, column=4).value = chapter_name
-            # Column E: PDF/Word Page # (leave empty)
-            # Column F: File Timecode
-            ws.cell(row=target_row, column=6).value = timecode
-            # Column G: Error Type
-            ws.cell(row=target_row, column=7).value = error_type
-            # Column H: Comments
-            ws.cell(row=target_row, column=8).value = comments
-
-            # Save workbook
-            wb.save(crx_path)
+            # Edit the cached workbook in memory; it is saved after CRX_FLUSH_DELAY of inactivity
+            with CRX_WORKBOOK_LOCK:
+                workbook = get_crx_workbook(crx_path)
+                sheet = workbook['sheet']
+
+                # Locate the row and all of its target cells in one pass
+                cells = row_cells(sheet_row(sheet, target_row), 'BDFGH')
+
+                # Ensure Error # is populated in this row (Column B)
+                if not NUMBER_RE.search(cell_text(workbook, cells['B'])):
+                    set_cell_text(workbook, cells['B'], f"{error_num:03d}")
+
+                # Write data to cells
+                # Column C: Recording Day (leave empty)
+                # Column D: Chapter/Section
+                set_cell_text(workbook, cells['D'], chapter_name)
+                # Column E: PDF/Word Page # (leave empty)
+                # Column F: File Timecode
+                set_cell_text(workbook, cells['F'], timecode)
+                # Column G: Error Type
+                set_cell_text(workbook, cells['G'], error_type)
+                # Column H: Comments
+                set_cell_text(workbook, cells['H'], comments)
+
+                schedule_crx_flush(crx_path)
 
             # Export the audio segment as {error_num:03d}.wav
-            audio_path = BASE_DIR / chapter_name / f"{chapter_name}.treated.wav"
-            if not audio_path.exists():
-                audio_path = BASE_DIR / chapter_name / f"{chapter_name}.wav"
-            if not audio_path.exists():
-                audio_path = BASE_DIR / f"{chapter_name}.wav"
+            audio_path, audio_found = self.find_chapter_audio(chapter_name, 'preferred')
 
-            if audio_path.exists():
+            if audio_found:
                 audio_filename = f"{error_num:03d}.wav"
                 audio_output_path = crx_dir / audio_filename
 
-                # Use ffmpeg to extract the segment with dynamic tail padding
+                # Extract the segment with dynamic tail padding
                 padding_sec = padding_ms / 1000.0
                 duration = (end_time - start_time) + padding_sec
-                cmd = [
-                    'ffmpeg',
-                    '-i', str(audio_path),
-                    '-ss', str(start_time),
-                    '-t', str(duration),
-                    '-c', 'copy',
-                    '-y',
-                    str(audio_output_path)
-                ]
-
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode != 0:
-                    print(f"Warning: ffmpeg failed to export audio: {result.stderr}")
+                error = self.extract_audio_segment(audio_path, start_time, duration, audio_output_path)
+                if error is not None:
+                    print(f"Warning: ffmpeg failed to export audio: {error}")
+                else:
+                    self.record_crx_error_number(crx_dir, error_num)
             else:
                 print(f"Warning: Audio file not found for {chapter_name}")
 
@@ -1529,16 +2673,83 @@ class ValidationReportHandler(BaseHTTPRequestHandler):
             })
 
         except Exception as e:
+            # Re-check the workbook on the next request (it may have been moved or deleted)
+            CRX_INITIALIZED.clear()
             print(f"Error adding to CRX: {e}")
             print(traceback.format_exc())
             self.send_json_response({'error': str(e)}, 500)
 
+    def send_audio_cache_headers(self, etag):
+        """Revalidate audio against etag, or forbid caching when there is none"""
+        if etag is not None:
+            self.send_validator(etag)
+        else:
+            self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate')
+            self.send_header('Pragma', 'no-cache')
+            self.send_header('Expires', '0')
+
     def send_json_response(self, data, status=200):
         """Helper to send JSON response"""
+        self.send_json_bytes(dumps_json(data), status)
+
+    def send_json_array_stream(self, prefix, items, suffix, keep=False, etag=None):
+        """Send prefix + a JSON array of items + suffix with chunked transfer encoding,
+        encoding one item at a time instead of the whole payload at once.
+        With keep, the complete payload is also returned (for caching)"""
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.send_validator(etag)
+        self.end_headers()
+
+        kept = [] if keep else None
+        buffer = bytearray(prefix)
+        buffer += b'['
+        for index, item in enumerate(items):
+            if index:
+                buffer += b','
+            buffer += dumps_json(item)
+            if len(buffer) >= JSON_STREAM_CHUNK_SIZE:
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(buffer), buffer))
+                if keep:
+                    kept.append(bytes(buffer))
+                buffer.clear()
+        buffer += b']'
+        buffer += suffix
+        self.wfile.write(b'%x\r\n%s\r\n0\r\n\r\n' % (len(buffer), buffer))
+        if keep:
+            kept.append(bytes(buffer))
+            return b''.join(kept)
+        return None
+
+    def send_json_bytes(self, payload, status=200, etag=None):
+        """Send an already encoded JSON payload"""
         self.send_response(status)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_validator(etag)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def send_validator(self, etag):
+        """Send an ETag with Cache-Control: no-cache, so the browser revalidates before reuse"""
+        if etag is not None:
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('ETag', etag)
+
+    def send_not_modified(self, etag, vary_encoding=False):
+        """Answer 304 when the client already holds the etag version; returns whether it did.
+
+        The 304 repeats the caching headers the full response would carry.
+        """
+        if etag not in self.headers.get('If-None-Match', ''):
+            return False
+        self.send_response(304)
+        self.send_validator(etag)
+        if vary_encoding:
+            self.send_header('Vary', 'Accept-Encoding')
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        return True
 
     def log_message(self, format, *args):
         """Custom log format"""
@@ -1558,7 +2769,8 @@ def main():
         sys.exit(1)
 
     server_address = ('', PORT)
-    httpd = HTTPServer(server_address, ValidationReportHandler)
+    # Each request runs on its own (daemon) thread so slow ffmpeg work doesn't stall the UI
+    httpd = ValidationReportServer(server_address, ValidationReportHandler)
 
     print(f"="*60)
     print(f"Validation Report Viewer")
@@ -17,6 +17,10 @@ let waveSurferInstances = {}; // Track WaveSurfer instances by ID
 let currentAudioSource = 'raw'; // 'raw', 'treated', or 'filtered'
 let selectedSentences = []; // Track ctrl+clicked sentences for multi-select
 let savedScrollPosition = 0; // Save scroll position when switching views
+let sentenceList = null; // VirtualList of error sentences in the errors view
+let paragraphList = null; // VirtualList of paragraphs in the errors view
+let pendingReportFrame = null; // requestAnimationFrame id of a queued errors-view render
+let reportView = null; // Errors-view sections, reused across reports
 
 // WaveSurfer Audio Player Component
 class WaveSurferPlayer {
@@ -435,11 +439,11 @@ function renderChapterList() {
     const list = document.getElementById('chapter-list');
 
     let html = `
-        <div class="chapter-item overview-item ${currentSpecialPage === 'overview' ? 'active' : ''}" onclick="loadOverview()">
+        <div class="chapter-item overview-item ${currentSpecialPage === 'overview' ? 'active' : ''}" data-action="open-overview">
             <div class="chapter-name">📊 Book Overview</div>
             <div class="chapter-stats">All Chapters</div>
         </div>
-        <div class="chapter-item patterns-item ${currentSpecialPage === 'patterns' ? 'active' : ''}" onclick="loadErrorPatterns()">
+        <div class="chapter-item patterns-item ${currentSpecialPage === 'patterns' ? 'active' : ''}" data-action="open-patterns">
             <div class="chapter-name">🧩 Error Patterns</div>
             <div class="chapter-stats">Across entire book</div>
         </div>
@@ -451,8 +455,8 @@ function renderChapterList() {
         const reviewedClass = isReviewed ? 'reviewed' : '';
         const flaggedInfo = `${m.sentenceFlagged} sentences, ${m.paragraphFlagged} paragraphs`;
         return `
-            <div class="chapter-item ${reviewedClass}" onclick="loadReport('${chapter.name}')">
-                <div class="chapter-name">${chapter.name}</div>
+            <div class="chapter-item ${reviewedClass}" data-action="open-chapter" data-chapter="${escapeHtml(chapter.name)}">
+                <div class="chapter-name">${escapeHtml(chapter.name)}</div>
                 <div class="chapter-stats">Flagged: ${flaggedInfo}</div>
                 <div class="chapter-stats">Avg WER: ${m.sentenceAvgWer}</div>
             </div>
@@ -494,34 +498,8 @@ async function loadOverview() {
 function renderOverview(overview) {
     const content = document.getElementById('content');
 
-    const chaptersHtml = overview.chapters.map(c => {
-        const m = c.metrics;
-        const werClass = parseFloat(m.sentenceAvgWer) > 5 ? 'high' : parseFloat(m.sentenceAvgWer) > 2 ? 'medium' : 'low';
-        const isReviewed = reviewedStatus[c.name]?.reviewed;
-        const reviewedClass = isReviewed ? 'reviewed' : '';
-
-        return `
-            <div class="chapter-card ${reviewedClass}" onclick="loadReport('${c.name}')">
-                <div class="chapter-card-header">
-                    <div class="chapter-card-name">${c.name}</div>
-                </div>
-                <div class="chapter-card-metrics">
-                    <div class="metric">
-                        <span class="metric-label">Sentences:</span>
-                        <span class="metric-value">${m.sentenceCount} (${m.sentenceFlagged} flagged)</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Paragraphs:</span>
-                        <span class="metric-value">${m.paragraphCount} (${m.paragraphFlagged} flagged)</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Avg WER:</span>
-                        <span class="metric-value ${werClass}">${m.sentenceAvgWer}</span>
-                    </div>
-                </div>
-            </div>
-        `;
-    }).join('');
+    const chapterCards = document.createDocumentFragment();
+    overview.chapters.forEach(c => chapterCards.appendChild(buildChapterCard(c)));
 
     content.innerHTML = `
         <div class="report-header">
@@ -549,12 +527,30 @@ function renderOverview(overview) {
 
         <div class="section-title" style="display: flex; justify-content: space-between; align-items: center;">
             <span>Chapters</span>
-            <button class="reset-review-button" onclick="resetAllReviews()">Reset All Review Status</button>
-        </div>
-        <div class="chapter-grid">
-            ${chaptersHtml}
+            <button class="reset-review-button" data-action="reset-reviews">Reset All Review Status</button>
         </div>
+        <div class="chapter-grid"></div>
     `;
+
+    content.querySelector('.chapter-grid').appendChild(chapterCards);
+}
+
+function buildChapterCard(c) {
+    const m = c.metrics;
+    const werClass = parseFloat(m.sentenceAvgWer) > 5 ? 'high' : parseFloat(m.sentenceAvgWer) > 2 ? 'medium' : 'low';
+
+    const card = cloneTemplate('chapter-card-template');
+    if (reviewedStatus[c.name]?.reviewed) {
+        card.classList.add('reviewed');
+    }
+    card.dataset.chapter = c.name;
+    card.querySelector('.chapter-card-name').textContent = c.name;
+    templateField(card, 'sentences').textContent = `${m.sentenceCount} (${m.sentenceFlagged} flagged)`;
+    templateField(card, 'paragraphs').textContent = `${m.paragraphCount} (${m.paragraphFlagged} flagged)`;
+    const wer = templateField(card, 'wer');
+    wer.classList.add(werClass);
+    wer.textContent = m.sentenceAvgWer;
+    return card;
 }
 
 // Report loading and rendering
@@ -626,6 +622,32 @@ function hasErrors(sentence) {
     return sentence.diff.ops.some(op => op.op === 'delete' || op.op === 'insert');
 }
 
+function getSentenceWer(sentence) {
+    // Hydrate reports ship the numeric value; text reports only have the label
+    if (typeof sentence.werRaw === 'number') return sentence.werRaw;
+    return parseFloat(sentence.wer?.replace('%', '') || 0);
+}
+
+// The server keeps sentences in reading order; WER ordering is built lazily
+// the first time the errors view needs it and reused on view switches
+const errorSentencesCache = new WeakMap();
+
+function sortSentencesByWer(sentences) {
+    const wers = Float64Array.from(sentences, getSentenceWer);
+    const order = Array.from(sentences, (_, i) => i);
+    order.sort((a, b) => wers[b] - wers[a]); // Descending order, stable for ties
+    return order.map(i => sentences[i]);
+}
+
+function getErrorSentences(report) {
+    let sorted = errorSentencesCache.get(report.sentences);
+    if (!sorted) {
+        sorted = sortSentencesByWer(report.sentences.filter(hasErrors));
+        errorSentencesCache.set(report.sentences, sorted);
+    }
+    return sorted;
+}
+
 // Playback view
 function renderPlaybackView(report) {
     const content = document.getElementById('content');
@@ -655,8 +677,8 @@ function renderPlaybackView(report) {
         </div>
 
         <div class="view-toggle">
-            <button class="view-toggle-button" data-view="errors" onclick="switchView('errors')">Errors View</button>
-            <button class="view-toggle-button active" data-view="playback" onclick="switchView('playback')">Playback View</button>
+            <button class="view-toggle-button" data-action="switch-view" data-view="errors">Errors View</button>
+            <button class="view-toggle-button active" data-action="switch-view" data-view="playback">Playback View</button>
         </div>
 
         <div id="chapter-audio-player"></div>
@@ -901,294 +923,444 @@ function renderReport(report) {
     currentReport = report;
     const content = document.getElementById('content');
 
+    cancelAnimationFrame(pendingReportFrame);
+    pendingReportFrame = null;
+
     if (currentView === 'playback') {
         renderPlaybackView(report);
         return;
     }
 
     // Filter and sort by WER descending for errors view
-    const filteredSentences = report.sentences
-        .filter(hasErrors)
-        .sort((a, b) => {
-            const werA = parseFloat(a.wer?.replace('%', '') || 0);
-            const werB = parseFloat(b.wer?.replace('%', '') || 0);
-            return werB - werA; // Descending order
+    const filteredSentences = getErrorSentences(report);
+
+    const quickErrors = document.createDocumentFragment();
+    filteredSentences.forEach(s => quickErrors.appendChild(buildErrorCard(s)));
+    if (!filteredSentences.length) {
+        const empty = document.createElement('div');
+        empty.className = 'empty-state';
+        empty.textContent = 'No sentence-level errors';
+        quickErrors.appendChild(empty);
+    }
+
+    // Swap the sections in on the next frame; a newer render or view change wins
+    pendingReportFrame = requestAnimationFrame(() => {
+        pendingReportFrame = null;
+        if (currentReport !== report || currentView !== 'errors' || currentSpecialPage !== null) {
+            return;
+        }
+
+        destroyReportLists();
+        sentenceList = new VirtualList(content, filteredSentences, buildSentenceItem, 320);
+        paragraphList = new VirtualList(content, report.paragraphs, p => buildParagraphItem(p, report.sentences), 220);
+
+        // The header and stats are refilled in place; only the lists are rebuilt
+        const view = getReportView();
+        const stats = report.stats;
+        setReportField(view, 'chapter', report.chapterName);
+        setReportField(view, 'audio', report.audioPath);
+        setReportField(view, 'script', report.scriptPath);
+        setReportField(view, 'created', report.created);
+        setReportField(view, 'sentence-count', stats.sentenceCount);
+        setReportField(view, 'avg-wer', stats.avgWer);
+        setReportField(view, 'max-wer', stats.maxWer);
+        setReportField(view, 'flagged-count', stats.flaggedCount);
+        setReportField(view, 'error-count', filteredSentences.length);
+        setReportField(view, 'paragraph-count', stats.paragraphCount);
+        setReportField(view, 'paragraph-avg-wer', stats.paragraphAvgWer);
+        setReportField(view, 'avg-coverage', stats.avgCoverage);
+        templateField(view, 'error-grid').replaceChildren(quickErrors);
+        templateField(view, 'sentences').replaceChildren(sentenceList.element);
+        templateField(view, 'paragraphs').replaceChildren(paragraphList.element);
+        // switchView toggles buttons document-wide, including these while they were shown
+        view.querySelectorAll('.view-toggle-button').forEach(btn => {
+            btn.classList.toggle('active', btn.dataset.view === 'errors');
         });
 
-    const quickErrorsHtml = filteredSentences.map(s => `
-        <div class="error-card" data-sentence-id="${s.id}">
-            <div class="error-card-header">
-                <span class="error-id">#${s.id}</span>
-                <span class="status-badge ${s.status}">${s.status}</span>
-            </div>
-            <div class="error-metrics">
-                <div class="metric">
-                    <span class="metric-label">WER</span>
-                    <span class="metric-value ${getMetricClass(parseFloat(s.wer?.replace('%', '') || 0))}">${s.wer}</span>
-                </div>
-                <div class="metric">
-                    <span class="metric-label">CER</span>
-                    <span class="metric-value ${getMetricClass(parseFloat(s.cer?.replace('%', '') || 0))}">${s.cer}</span>
-                </div>
-                ${getSentenceTimingDisplay(s) ? `
-                <div class="metric">
-                    <span class="metric-label">Time</span>
-                    <span class="metric-value">${getSentenceTimingDisplay(s)}</span>
-                </div>` : ''}
-            </div>
-            <div class="error-snippet">${getErrorSnippet(s)}</div>
-        </div>
-    `).join('');
-
-    const sentencesHtml = filteredSentences.map(s => `
-        <div id="sentence-${s.id}" class="sentence-item ${s.status}" data-sentence-id="${s.id}" data-start="${s.startTime}" style="cursor: pointer;">
-            <div class="sentence-header">
-                <span class="sentence-id">#${s.id}</span>
-                <div class="sentence-metrics">
-                    <div class="metric">
-                        <span class="metric-label">WER:</span>
-                        <span class="metric-value ${getMetricClass(s.wer)}">${s.wer}</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">CER:</span>
-                        <span class="metric-value ${getMetricClass(s.cer)}">${s.cer}</span>
-                    </div>
-                    <span class="status-badge ${s.status}">${s.status}</span>
-                </div>
-            </div>
-            <div class="sentence-details">
-                <div>Book range: ${s.bookRange}</div>
-                <div>Script range: ${s.scriptRange}</div>
-                <div>Timing: ${s.timing}</div>
-                ${s.paragraphId !== null && s.paragraphId !== undefined ? `<div class="paragraph-flags">Parent paragraph: <a href="#paragraph-${s.paragraphId}" onclick="focusParagraph(${s.paragraphId}); return false;">#${s.paragraphId}</a></div>` : ''}
-            </div>
-            <div class="sentence-text">
-                ${s.diff && s.diff.ops ? `
-                    <div class="text-label">Manuscript</div>
-                    <div class="text-content">${escapeHtml(s.bookText)}</div>
-                    <div class="text-label" style="margin-top: 12px;">Transcript</div>
-                    <div class="diff-unified" data-sentence-id="${s.id}"></div>
-                ` : s.scriptText && s.bookText ? `
-                    <div class="text-label">Script (Read as)</div>
-                    <div class="text-content diff-text" data-sentence-id="${s.id}" data-diff-script="${escapeHtml(s.scriptText)}" data-diff-book="${escapeHtml(s.bookText)}"></div>
-                    <div class="text-label" style="margin-top: 12px;">Book (Should be)</div>
-                    <div class="text-content diff-text" data-sentence-id="${s.id}" data-diff-script="${escapeHtml(s.scriptText)}" data-diff-book="${escapeHtml(s.bookText)}" data-diff-type="book"></div>
-                ` : `
-                    <div class="text-label">Book</div>
-                    <div class="text-content">${escapeHtml(s.bookText)}</div>
-                    ${s.scriptText ? `
-                        <div class="text-label" style="margin-top: 12px;">Script</div>
-                        <div class="text-content">${escapeHtml(s.scriptText)}</div>
-                    ` : ''}
-                `}
-            </div>
-            ${s.startTime !== null && s.endTime !== null ? `
-                <div class="action-buttons">
-                    <button class="play-button" onclick="playAudioSegment('${currentChapter}', ${s.startTime}, ${s.endTime})">
-                        <span class="play-icon"></span>
-                        Play Audio Segment
-                    </button>
-                    <button class="export-button" data-chapter="${currentChapter}" data-start="${s.startTime}" data-end="${s.endTime}" data-sentence-id="${s.id}" data-excerpt="${escapeHtml(s.excerpt || '')}">
-                        Export Audio
-                    </button>
-                    <button class="crx-button" data-chapter="${currentChapter}" data-start="${s.startTime}" data-end="${s.endTime}" data-sentence-id="${s.id}" data-excerpt="${escapeHtml(s.excerpt || '')}">
-                        Add to CRX
-                    </button>
-                    <button class="ignore-button" data-sentence-id="${s.id}">
-                        Ignore Error…
-                    </button>
-                </div>
-            ` : ''}
-        </div>
-    `).join('');
-
-    const paragraphsHtml = report.paragraphs.map(p => `
-        <div id="paragraph-${p.id}" class="paragraph-item ${p.status}">
-            <div class="sentence-header">
-                <span class="sentence-id">#${p.id}</span>
-                <div class="sentence-metrics">
-                    <div class="metric">
-                        <span class="metric-label">WER:</span>
-                        <span class="metric-value ${getMetricClass(parseFloat(p.wer))}">${p.wer}</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Coverage:</span>
-                        <span class="metric-value">${p.coverage}</span>
-                    </div>
-                    <span class="status-badge ${p.status}">${p.status}</span>
-                </div>
-            </div>
-            <div class="sentence-details">
-                <div>Book range: ${p.bookRange}</div>
-                ${p.timing ? `<div>Timing: ${p.timing}</div>` : ''}
-                ${Array.isArray(p.flaggedSentenceIds) && p.flaggedSentenceIds.length ? `<div class="paragraph-flags">Flagged sentences: ${p.flaggedSentenceIds.map(id => `<a href="#sentence-${id}" onclick="focusSentence(${id}); return false;">#${id}</a>`).join(', ')}</div>` : ''}
-            </div>
-            ${p.bookText ? `
-                <div class="sentence-text">
-                    <div class="text-label">Book</div>
-                    <div class="text-content">${renderParagraphText(p.bookText, p.flaggedSentenceIds || [], report.sentences)}</div>
-                </div>
-            ` : ''}
-            ${p.startTime !== null && p.endTime !== null ? `
-                <div class="action-buttons">
-                    <button class="play-button" onclick="playAudioSegment('${currentChapter}', ${p.startTime}, ${p.endTime})">
-                        <span class="play-icon"></span>
-                        Play Paragraph Audio
-                    </button>
-                </div>
-            ` : ''}
-        </div>
-    `).join('');
+        if (view.parentNode !== content) {
+            content.replaceChildren(view);
+        }
+        sentenceList.update();
+        paragraphList.update();
+    });
+}
 
-    content.innerHTML = `
-        <div class="report-header">
-            <h1>${report.chapterName}</h1>
-            <div class="report-meta">
-                <div class="meta-item"><span class="meta-label">Audio:</span> ${report.audioPath}</div>
-                <div class="meta-item"><span class="meta-label">Script:</span> ${report.scriptPath}</div>
-                <div class="meta-item"><span class="meta-label">Created:</span> ${report.created}</div>
-            </div>
-        </div>
+// The errors view is built once and kept while other pages borrow #content
+function getReportView() {
+    if (!reportView) {
+        reportView = cloneTemplate('report-view-template');
+    }
+    return reportView;
+}
 
-        <div class="view-toggle">
-            <button class="view-toggle-button active" data-view="errors" onclick="switchView('errors')">Errors View</button>
-            <button class="view-toggle-button" data-view="playback" onclick="switchView('playback')">Playback View</button>
-        </div>
+function setReportField(view, name, value) {
+    const text = String(value);
+    view.querySelectorAll(`[data-field="${name}"]`).forEach(field => {
+        if (field.textContent !== text) field.textContent = text;
+    });
+}
 
-        <div class="stats-grid">
-            <div class="stat-card">
-                <div class="stat-label">Sentences</div>
-                <div class="stat-value">${report.stats.sentenceCount}</div>
-                <div class="stat-detail">
-                    Avg WER ${report.stats.avgWer} | Max WER ${report.stats.maxWer}
-                </div>
-                <div class="stat-detail">Flagged: ${report.stats.flaggedCount}</div>
-                <div class="stat-detail">With Errors: ${filteredSentences.length}</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Paragraphs</div>
-                <div class="stat-value">${report.stats.paragraphCount}</div>
-                <div class="stat-detail">
-                    Avg WER ${report.stats.paragraphAvgWer}
-                </div>
-                <div class="stat-detail">Avg Coverage ${report.stats.avgCoverage}</div>
-            </div>
-        </div>
+function buildErrorCard(s) {
+    const card = cloneTemplate('error-card-template');
+    card.dataset.sentenceId = s.id;
+    card.querySelector('.error-id').textContent = `#${s.id}`;
+    setStatusBadge(card, s.status);
 
-        <div class="section-title">Quick Error Grid</div>
-        <div class="error-grid">
-            ${quickErrorsHtml || '<div class="empty-state">No sentence-level errors</div>'}
-        </div>
+    const wer = templateField(card, 'wer');
+    wer.classList.add(getMetricClass(getSentenceWer(s)));
+    wer.textContent = s.wer;
+    const cer = templateField(card, 'cer');
+    cer.classList.add(getMetricClass(parseFloat(s.cer?.replace('%', '') || 0)));
+    cer.textContent = s.cer;
 
-        <div class="section-title">Sentences with Errors (${filteredSentences.length})</div>
-        ${sentencesHtml}
+    const timing = getSentenceTimingDisplay(s);
+    if (timing) {
+        templateField(card, 'time').textContent = timing;
+    } else {
+        templateField(card, 'time-metric').remove();
+    }
+
+    card.querySelector('.error-snippet').innerHTML = getErrorSnippet(s);
+    return card;
+}
+
+function buildSentenceItem(s) {
+    const item = cloneTemplate('sentence-item-template');
+    item.id = `sentence-${s.id}`;
+    item.className = `sentence-item ${s.status}`;
+    item.dataset.sentenceId = s.id;
+    item.querySelector('.sentence-id').textContent = `#${s.id}`;
+    setStatusBadge(item, s.status);
+    if (s.startTime !== null) {
+        // Buttons and links inside the row carry their own data-action
+        item.dataset.action = 'open-playback';
+        item.dataset.start = s.startTime;
+    }
+
+    const wer = templateField(item, 'wer');
+    wer.classList.add(getMetricClass(s.wer));
+    wer.textContent = s.wer;
+    const cer = templateField(item, 'cer');
+    cer.classList.add(getMetricClass(s.cer));
+    cer.textContent = s.cer;
+
+    templateField(item, 'book-range').textContent = `Book range: ${s.bookRange}`;
+    templateField(item, 'script-range').textContent = `Script range: ${s.scriptRange}`;
+    templateField(item, 'timing').textContent = `Timing: ${s.timing}`;
+
+    const parent = templateField(item, 'parent');
+    if (s.paragraphId !== null && s.paragraphId !== undefined) {
+        const link = parent.querySelector('a');
+        link.href = `#paragraph-${s.paragraphId}`;
+        link.textContent = `#${s.paragraphId}`;
+        link.dataset.paragraphId = s.paragraphId;
+    } else {
+        parent.remove();
+    }
 
-        <div class="section-title">Paragraphs by WER</div>
-        ${paragraphsHtml}
-    `;
+    const text = item.querySelector('.sentence-text');
+    if (s.diff && s.diff.ops) {
+        appendTextBlock(text, 'Manuscript', s.bookText);
+        appendTextBlock(text, 'Transcript', null, renderUnifiedDiff(s.diff), 'diff-unified');
+    } else if (s.scriptText && s.bookText) {
+        const highlighted = highlightDifferencesVisual(s.scriptText, s.bookText, Array.isArray(s.wordOps) ? s.wordOps : null);
+        appendTextBlock(text, 'Script (Read as)', null, highlighted.scriptHighlighted, 'text-content diff-text');
+        appendTextBlock(text, 'Book (Should be)', null, highlighted.bookHighlighted, 'text-content diff-text');
+    } else {
+        appendTextBlock(text, 'Book', s.bookText);
+        if (s.scriptText) {
+            appendTextBlock(text, 'Script', s.scriptText);
+        }
+    }
 
-    setTimeout(() => {
-        document.querySelectorAll('.export-button').forEach(btn => {
-            btn.addEventListener('click', function() {
-                const chapter = this.getAttribute('data-chapter');
-                const start = parseFloat(this.getAttribute('data-start'));
-                const end = parseFloat(this.getAttribute('data-end'));
-                const sentenceId = this.getAttribute('data-sentence-id');
-                const excerpt = this.getAttribute('data-excerpt');
-                exportAudio(chapter, start, end, sentenceId, excerpt);
-            });
+    const actions = item.querySelector('.action-buttons');
+    if (s.startTime !== null && s.endTime !== null) {
+        actions.querySelectorAll('button').forEach(btn => {
+            btn.dataset.start = s.startTime;
+            btn.dataset.end = s.endTime;
+            btn.dataset.sentenceId = s.id;
         });
-
-        document.querySelectorAll('.crx-button').forEach(btn => {
-            btn.addEventListener('click', function() {
-                const chapter = this.getAttribute('data-chapter');
-                const start = parseFloat(this.getAttribute('data-start'));
-                const end = parseFloat(this.getAttribute('data-end'));
-                const sentenceId = parseInt(this.getAttribute('data-sentence-id'), 10);
-                const excerpt = this.getAttribute('data-excerpt');
-                openCrxModal(chapter, start, end, sentenceId, excerpt);
-            });
+        actions.querySelectorAll('.export-button, .crx-button').forEach(btn => {
+            btn.dataset.excerpt = s.excerpt || '';
         });
+    } else {
+        actions.remove();
+    }
 
-        document.querySelectorAll('.ignore-button').forEach(btn => {
-            btn.addEventListener('click', function() {
-                const sentenceId = parseInt(this.getAttribute('data-sentence-id'), 10);
-                if (!isNaN(sentenceId)) {
-                    openIgnoreModal(sentenceId);
-                }
-            });
-        });
+    return item;
+}
 
-        // Add click listeners to sentence items in errors view
-        document.querySelectorAll('.sentence-item').forEach(item => {
-            item.addEventListener('click', function(e) {
-                // Don't trigger if clicking on buttons or interactive elements
-                if (e.target.closest('button') || e.target.closest('a')) {
-                    return;
-                }
-                const sentenceId = parseInt(this.getAttribute('data-sentence-id'), 10);
-                const startTime = parseFloat(this.getAttribute('data-start'));
-                if (!isNaN(sentenceId) && !isNaN(startTime)) {
-                    switchView('playback');
-                    // Wait for view to render, then scroll to sentence
-                    setTimeout(() => {
-                        const targetSentence = document.querySelector(`.compact-sentence[data-sentence-id="${sentenceId}"]`);
-                        if (targetSentence) {
-                            targetSentence.scrollIntoView({ behavior: 'smooth', block: 'center' });
-                            targetSentence.classList.add('highlight-flash');
-                            setTimeout(() => targetSentence.classList.remove('highlight-flash'), 2000);
-                        }
-                        seekToSentence(sentenceId, startTime);
-                    }, 100);
-                }
-            });
-        });
+function buildParagraphItem(p, sentences) {
+    const item = cloneTemplate('paragraph-item-template');
+    item.id = `paragraph-${p.id}`;
+    item.className = `paragraph-item ${p.status}`;
+    item.querySelector('.sentence-id').textContent = `#${p.id}`;
+    setStatusBadge(item, p.status);
 
-        // Quick grid jump-to handlers
-        document.querySelectorAll('.error-card').forEach(card => {
-            card.addEventListener('click', () => {
-                const sentenceId = parseInt(card.getAttribute('data-sentence-id'), 10);
-                if (!isNaN(sentenceId)) {
-                    focusSentence(sentenceId);
-                }
-            });
+    const wer = templateField(item, 'wer');
+    wer.classList.add(getMetricClass(parseFloat(p.wer)));
+    wer.textContent = p.wer;
+    templateField(item, 'coverage').textContent = p.coverage;
+
+    templateField(item, 'book-range').textContent = `Book range: ${p.bookRange}`;
+    if (p.timing) {
+        templateField(item, 'timing').textContent = `Timing: ${p.timing}`;
+    } else {
+        templateField(item, 'timing').remove();
+    }
+
+    const flagged = templateField(item, 'flagged');
+    if (Array.isArray(p.flaggedSentenceIds) && p.flaggedSentenceIds.length) {
+        p.flaggedSentenceIds.forEach((id, index) => {
+            if (index > 0) flagged.append(', ');
+            const link = document.createElement('a');
+            link.href = `#sentence-${id}`;
+            link.textContent = `#${id}`;
+            link.dataset.action = 'focus-sentence';
+            link.dataset.sentenceId = id;
+            flagged.appendChild(link);
         });
+    } else {
+        flagged.remove();
+    }
 
-        document.querySelectorAll('.diff-text').forEach(elem => {
-            const sentenceIdAttr = elem.getAttribute('data-sentence-id');
-            const diffType = elem.getAttribute('data-diff-type') || 'script';
-            const scriptRaw = elem.getAttribute('data-diff-script');
-            const bookRaw = elem.getAttribute('data-diff-book');
-
-            const scriptText = decodeHtml(scriptRaw);
-            const bookText = decodeHtml(bookRaw);
-
-            let wordOps = null;
-            if (sentenceIdAttr && currentReport && Array.isArray(currentReport.sentences)) {
-                const sentenceId = parseInt(sentenceIdAttr, 10);
-                const sentenceData = currentReport.sentences.find(s => s.id === sentenceId);
-                if (sentenceData && Array.isArray(sentenceData.wordOps)) {
-                    wordOps = sentenceData.wordOps;
-                }
+    const text = item.querySelector('.sentence-text');
+    if (p.bookText) {
+        text.querySelector('.text-content').appendChild(renderParagraphText(p.bookText, p.flaggedSentenceIds || [], sentences));
+    } else {
+        text.remove();
+    }
+
+    const actions = item.querySelector('.action-buttons');
+    if (p.startTime !== null && p.endTime !== null) {
+        const play = actions.querySelector('.play-button');
+        play.dataset.start = p.startTime;
+        play.dataset.end = p.endTime;
+    } else {
+        actions.remove();
+    }
+
+    return item;
+}
+
+// Adds a label/content pair to a sentence text block; html is trusted markup
+function appendTextBlock(container, label, text, html = null, className = 'text-content') {
+    const labelDiv = document.createElement('div');
+    labelDiv.className = 'text-label';
+    labelDiv.textContent = label;
+    if (container.childElementCount > 0) {
+        labelDiv.style.marginTop = '12px';
+    }
+
+    const contentDiv = document.createElement('div');
+    contentDiv.className = className;
+    if (html !== null) {
+        contentDiv.innerHTML = html;
+    } else {
+        contentDiv.textContent = text;
+    }
+
+    container.append(labelDiv, contentDiv);
+}
+
+function openSentenceInPlayback(sentenceId, startTime) {
+    switchView('playback');
+    // Wait for view to render, then scroll to sentence
+    setTimeout(() => {
+        const targetSentence = document.querySelector(`.compact-sentence[data-sentence-id="${sentenceId}"]`);
+        if (targetSentence) {
+            targetSentence.scrollIntoView({ behavior: 'smooth', block: 'center' });
+            flashElement(targetSentence, 'highlight-flash');
+        }
+        seekToSentence(sentenceId, startTime);
+    }, 100);
+}
+
+// Windowed list: only rows near the viewport of the scroller are in the DOM.
+// Rows vary in height, so unseen rows use an estimate until first rendered.
+const VIRTUAL_LIST_MIN_ROWS = 50; // Shorter lists are rendered in full
+const VIRTUAL_LIST_OVERSCAN = 4;
+
+class VirtualList {
+    constructor(scroller, items, buildRow, estimatedRowHeight) {
+        this.scroller = scroller;
+        this.items = items;
+        this.buildRow = buildRow;
+        this.heights = new Float64Array(items.length).fill(estimatedRowHeight);
+        // offsets[i] is the top of row i (prefix sums of heights); offsets[length] is the total
+        this.offsets = new Float64Array(items.length + 1);
+        this.refreshOffsets(0);
+        this.rows = new Map(); // item index -> rendered node
+        this.rowMargin = null;
+        this.frame = null;
+
+        this.element = document.createElement('div');
+        this.element.className = 'virtual-list';
+
+        this.onScroll = () => {
+            if (this.frame === null) {
+                this.frame = requestAnimationFrame(() => this.update());
             }
+        };
+        scroller.addEventListener('scroll', this.onScroll, { passive: true });
+    }
+
+    destroy() {
+        this.scroller.removeEventListener('scroll', this.onScroll);
+        if (this.frame !== null) {
+            cancelAnimationFrame(this.frame);
+            this.frame = null;
+        }
+        this.rows.clear();
+    }
+
+    // Offset of the list's top edge within the scroller's content
+    listTop() {
+        return this.element.getBoundingClientRect().top
+            - this.scroller.getBoundingClientRect().top
+            + this.scroller.scrollTop;
+    }
+
+    offsetOf(index) {
+        return this.offsets[index];
+    }
+
+    // Recompute the prefix sums after heights changed at index from and later
+    refreshOffsets(from) {
+        const { heights, offsets } = this;
+        for (let i = from; i < heights.length; i++) {
+            offsets[i + 1] = offsets[i] + heights[i];
+        }
+    }
+
+    // Index of the row containing offset (the row count when past the end), by binary search
+    indexAt(offset) {
+        let low = 0;
+        let high = this.items.length;
+        while (low < high) {
+            const mid = (low + high) >> 1;
+            if (this.offsets[mid + 1] <= offset) low = mid + 1;
+            else high = mid;
+        }
+        return low;
+    }
+
+    update() {
+        this.frame = null;
+        if (!this.element.isConnected) {
+            this.destroy();
+            return;
+        }
+
+        const count = this.items.length;
+        let start = 0;
+        let end = count;
+        if (count > VIRTUAL_LIST_MIN_ROWS) {
+            const viewTop = this.scroller.scrollTop - this.listTop();
+            const viewBottom = viewTop + this.scroller.clientHeight;
+            start = Math.max(0, this.indexAt(viewTop) - VIRTUAL_LIST_OVERSCAN);
+            end = Math.min(count, this.indexAt(viewBottom) + 1 + VIRTUAL_LIST_OVERSCAN);
+        }
+
+        this.renderRange(start, end);
+    }
 
-            if (scriptText || bookText) {
-                const highlighted = highlightDifferencesVisual(scriptText, bookText, wordOps);
-                elem.innerHTML = diffType === 'book' ? highlighted.bookHighlighted : highlighted.scriptHighlighted;
+    renderRange(start, end) {
+        const nodes = [];
+        for (let i = start; i < end; i++) {
+            let node = this.rows.get(i);
+            if (!node) {
+                node = this.buildRow(this.items[i]);
+                this.rows.set(i, node);
             }
-        });
+            nodes.push(node);
+        }
+        for (const index of this.rows.keys()) {
+            if (index < start || index >= end) this.rows.delete(index);
+        }
+        this.element.replaceChildren(...nodes);
 
-        document.querySelectorAll('.diff-unified').forEach(elem => {
-            const sentenceIdAttr = elem.getAttribute('data-sentence-id');
-            if (sentenceIdAttr && currentReport && Array.isArray(currentReport.sentences)) {
-                const sentenceId = parseInt(sentenceIdAttr, 10);
-                const sentenceData = currentReport.sentences.find(s => s.id === sentenceId);
-                if (sentenceData && sentenceData.diff) {
-                    elem.innerHTML = renderUnifiedDiff(sentenceData.diff);
-                }
+        // Measure what was rendered; collapsed margins sit between rows
+        if (this.rowMargin === null && nodes.length) {
+            const style = getComputedStyle(nodes[0]);
+            this.rowMargin = parseFloat(style.marginTop) + parseFloat(style.marginBottom);
+        }
+        let firstChanged = -1;
+        nodes.forEach((node, i) => {
+            const height = node.offsetHeight + this.rowMargin;
+            if (height !== this.heights[start + i]) {
+                this.heights[start + i] = height;
+                if (firstChanged < 0) firstChanged = start + i;
             }
         });
-    }, 0);
+        const changed = firstChanged >= 0;
+        if (changed) this.refreshOffsets(firstChanged);
+
+        const before = this.offsets[start];
+        const after = this.offsets[this.items.length] - this.offsets[end];
+        this.element.style.paddingTop = `${before}px`;
+        this.element.style.paddingBottom = `${after}px`;
+
+        // Measured rows may be shorter than estimated and leave a gap
+        if (changed && this.items.length > VIRTUAL_LIST_MIN_ROWS) {
+            this.onScroll();
+        }
+    }
+
+    // Scroll the first row matching predicate into view and return its node
+    reveal(predicate) {
+        if (!this.element.isConnected) return null;
+        const index = this.items.findIndex(predicate);
+        if (index < 0) return null;
+
+        if (!this.rows.has(index)) {
+            this.scroller.scrollTop = this.listTop() + this.offsetOf(index)
+                - (this.scroller.clientHeight - this.heights[index]) / 2;
+            this.update();
+        }
+        return this.rows.get(index) || null;
+    }
+}
+
+function destroyReportLists() {
+    if (sentenceList) sentenceList.destroy();
+    if (paragraphList) paragraphList.destroy();
+    sentenceList = null;
+    paragraphList = null;
+}
+
+// Clicks in the content area, sidebar and mobile chapter menu are delegated by data-action
+const clickActions = {
+    'open-overview': () => loadOverview(),
+    'open-patterns': () => loadErrorPatterns(),
+    'open-chapter': el => loadReport(el.dataset.chapter),
+    'open-chapter-menu': el => {
+        loadReport(el.dataset.chapter);
+        toggleMobileChapters();
+    },
+    'reset-reviews': () => resetAllReviews(),
+    'switch-view': el => switchView(el.dataset.view),
+    'focus-sentence': el => focusSentence(parseInt(el.dataset.sentenceId, 10)),
+    'focus-paragraph': el => focusParagraph(parseInt(el.dataset.paragraphId, 10)),
+    'open-playback': el => openSentenceInPlayback(parseInt(el.dataset.sentenceId, 10), parseFloat(el.dataset.start)),
+    'play': el => playAudioSegment(currentChapter, parseFloat(el.dataset.start), parseFloat(el.dataset.end)),
+    'export': el => exportAudio(currentChapter, parseFloat(el.dataset.start), parseFloat(el.dataset.end),
+        el.dataset.sentenceId, el.dataset.excerpt),
+    'crx': el => openCrxModal(currentChapter, parseFloat(el.dataset.start), parseFloat(el.dataset.end),
+        parseInt(el.dataset.sentenceId, 10), el.dataset.excerpt),
+    'ignore': el => openIgnoreModal(parseInt(el.dataset.sentenceId, 10)),
+};
+
+function setupClickActions(root) {
+    root.addEventListener('click', (e) => {
+        const target = e.target.closest('[data-action]');
+        if (!target || !root.contains(target)) return;
+
+        const action = clickActions[target.dataset.action];
+        if (!action) return;
+        if (target.tagName === 'A') e.preventDefault();
+        action(target);
+    });
 }
 
 // Error patterns view
@@ -1383,10 +1555,28 @@ function getErrorSnippet(sentence) {
     return 'No transcript available';
 }
 
+// Row templates live in index.html; clones are filled with textContent
+function cloneTemplate(id) {
+    return document.getElementById(id).content.firstElementChild.cloneNode(true);
+}
+
+function templateField(root, name) {
+    return root.querySelector(`[data-field="${name}"]`);
+}
+
+function setStatusBadge(root, status) {
+    const badge = root.querySelector('.status-badge');
+    badge.className = `status-badge ${status}`;
+    badge.textContent = status;
+}
+
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+const HTML_ESCAPE_RE = /[&<>"']/g;
+
+// Quotes are escaped too, so the result is safe in attribute values
 function escapeHtml(text) {
-    const div = document.createElement('div');
-    div.textContent = text;
-    return div.innerHTML;
+    if (text == null) return '';
+    return String(text).replace(HTML_ESCAPE_RE, c => HTML_ESCAPES[c]);
 }
 
 function decodeHtml(html) {
@@ -1422,48 +1612,106 @@ function playAudioSegment(chapterName, startTime, endTime) {
 }
 
 // Navigation
+// Restart a one-shot CSS flash. The class stays on the element once the
+// animation ends, so repeated focuses leave no timers behind.
+function flashElement(element, className) {
+    element.classList.remove(className);
+    void element.offsetWidth; // Force a style flush so the animation restarts
+    element.classList.add(className);
+}
+
 function focusSentence(sentenceId) {
-    const element = document.getElementById(`sentence-${sentenceId}`);
+    const element = document.getElementById(`sentence-${sentenceId}`)
+        || (sentenceList && sentenceList.reveal(s => s.id === sentenceId));
     if (!element) return;
 
     element.scrollIntoView({ behavior: 'smooth', block: 'center' });
-    element.classList.add('highlight');
-    setTimeout(() => element.classList.remove('highlight'), 1600);
+    flashElement(element, 'highlight');
 }
 
 function focusParagraph(paragraphId) {
-    const element = document.getElementById(`paragraph-${paragraphId}`);
+    const element = document.getElementById(`paragraph-${paragraphId}`)
+        || (paragraphList && paragraphList.reveal(p => p.id === paragraphId));
     if (!element) return;
 
     element.scrollIntoView({ behavior: 'smooth', block: 'center' });
-    element.classList.add('highlight');
-    setTimeout(() => element.classList.remove('highlight'), 1600);
+    flashElement(element, 'highlight');
 }
 
-function renderParagraphText(paragraphText, flaggedSentenceIds, allSentences) {
-    if (!flaggedSentenceIds || flaggedSentenceIds.length === 0) {
-        return escapeHtml(paragraphText);
+// Flagged sentences are located in the raw paragraph text and linked with DOM
+// nodes, so nothing is escaped or matched by regex. The flagged texts are kept
+// per report (sentences array) and flagged-id list, since windowed paragraph
+// rows are rebuilt as they scroll back into view.
+const paragraphLinkCache = new WeakMap();
+
+function getParagraphLinkTargets(flaggedSentenceIds, allSentences) {
+    let targets = paragraphLinkCache.get(allSentences);
+    if (!targets) {
+        targets = new Map();
+        paragraphLinkCache.set(allSentences, targets);
     }
 
-    const sentenceMap = {};
+    const key = flaggedSentenceIds.join(',');
+    let links = targets.get(key);
+    if (links) return links;
+
+    const flagged = new Set(flaggedSentenceIds);
+    const textById = new Map();
     allSentences.forEach(s => {
-        if (flaggedSentenceIds.includes(s.id)) {
-            sentenceMap[s.id] = s.bookText;
+        if (flagged.has(s.id) && s.bookText) {
+            textById.set(s.id, s.bookText);
         }
     });
 
-    let result = escapeHtml(paragraphText);
-
+    // One target per distinct text; the first flagged id wins
+    const seen = new Set();
+    links = [];
     flaggedSentenceIds.forEach(sentenceId => {
-        const sentenceText = sentenceMap[sentenceId];
-        if (!sentenceText) return;
+        const text = textById.get(sentenceId);
+        if (text && !seen.has(text)) {
+            seen.add(text);
+            links.push({ text, sentenceId });
+        }
+    });
+    targets.set(key, links);
+    return links;
+}
 
-        const escapedSentenceText = escapeHtml(sentenceText);
-        const regex = new RegExp(escapedSentenceText.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'), 'g');
-        result = result.replace(regex, `<a href="#sentence-${sentenceId}" onclick="focusSentence(${sentenceId}); return false;" style="color: #4ec9b0; text-decoration: none;">${escapedSentenceText}</a>`);
+function renderParagraphText(paragraphText, flaggedSentenceIds, allSentences) {
+    const fragment = document.createDocumentFragment();
+    const links = flaggedSentenceIds && flaggedSentenceIds.length
+        ? getParagraphLinkTargets(flaggedSentenceIds, allSentences)
+        : [];
+
+    // Every occurrence of every flagged text; earlier and then longer matches win overlaps
+    const matches = [];
+    links.forEach(link => {
+        for (let at = paragraphText.indexOf(link.text); at !== -1; at = paragraphText.indexOf(link.text, at + link.text.length)) {
+            matches.push({ start: at, end: at + link.text.length, sentenceId: link.sentenceId });
+        }
     });
+    matches.sort((a, b) => a.start - b.start || b.end - a.end);
 
-    return result;
+    let position = 0;
+    matches.forEach(match => {
+        if (match.start < position) return;
+        if (match.start > position) {
+            fragment.append(paragraphText.slice(position, match.start));
+        }
+        const anchor = document.createElement('a');
+        anchor.href = `#sentence-${match.sentenceId}`;
+        anchor.dataset.action = 'focus-sentence';
+        anchor.dataset.sentenceId = match.sentenceId;
+        anchor.style.color = '#4ec9b0';
+        anchor.style.textDecoration = 'none';
+        anchor.textContent = paragraphText.slice(match.start, match.end);
+        fragment.appendChild(anchor);
+        position = match.end;
+    });
+    if (position < paragraphText.length) {
+        fragment.append(paragraphText.slice(position));
+    }
+    return fragment;
 }
 
 // Export functions
@@ -1837,6 +2085,155 @@ async function submitCrx() {
 }
 
 // Diff highlighting
+const FNV_OFFSET = 0x811c9dc5;
+const FNV_PRIME = 0x01000193;
+const MAX_PHRASE_WORDS = 3;
+
+// Characters ignored when comparing words: an ASCII lookup table plus the
+// two dashes. Letters are compared case-insensitively.
+const DIFF_PUNCT = new Uint8Array(128);
+for (const c of ".,!?;:'\"()-") DIFF_PUNCT[c.charCodeAt(0)] = 1;
+
+function foldDiffChar(code) {
+    if (code < 128) {
+        if (DIFF_PUNCT[code]) return -1;
+        return code >= 65 && code <= 90 ? code + 32 : code;
+    }
+    if (code === 0x2013 || code === 0x2014) return -1;
+    return String.fromCharCode(code).toLowerCase().charCodeAt(0);
+}
+
+function isDiffSpace(code) {
+    return code <= 32 || code === 0xa0 || code === 0x1680 || (code >= 0x2000 && code <= 0x200a)
+        || code === 0x2028 || code === 0x2029 || code === 0x202f || code === 0x205f
+        || code === 0x3000 || code === 0xfeff;
+}
+
+// Locate each whitespace-separated word as a [start, end) span of the text and
+// hash every 1..3 word phrase starting at each position. The n-gram hash
+// continues the FNV-1a state across words, so it equals the hash of the
+// phrase's folded characters with the word breaks removed. Words are only
+// sliced out of the text when they are emitted.
+function buildPhraseHashes(text) {
+    const starts = [];
+    const ends = [];
+    let k = 0;
+    while (k < text.length) {
+        while (k < text.length && isDiffSpace(text.charCodeAt(k))) k++;
+        if (k >= text.length) break;
+        starts.push(k);
+        while (k < text.length && !isDiffSpace(text.charCodeAt(k))) k++;
+        ends.push(k);
+    }
+
+    const count = starts.length;
+    const grams = [];
+    for (let n = 0; n < MAX_PHRASE_WORDS; n++) {
+        grams.push(new Uint32Array(count));
+    }
+    for (let w = 0; w < count; w++) {
+        let hash = FNV_OFFSET;
+        for (let n = 0; n < MAX_PHRASE_WORDS && w + n < count; n++) {
+            for (let c = starts[w + n]; c < ends[w + n]; c++) {
+                const code = foldDiffChar(text.charCodeAt(c));
+                if (code < 0) continue;
+                hash ^= code;
+                hash = Math.imul(hash, FNV_PRIME);
+            }
+            grams[n][w] = hash >>> 0;
+        }
+    }
+    return { text, count, starts: Uint32Array.from(starts), ends: Uint32Array.from(ends), grams };
+}
+
+function diffWord(phrases, index) {
+    return phrases.text.slice(phrases.starts[index], phrases.ends[index]);
+}
+
+function diffPhrase(phrases, from, to) {
+    const words = [];
+    for (let k = from; k < to; k++) words.push(diffWord(phrases, k));
+    return words.join(' ');
+}
+
+// Compare words [aFrom, aTo) of a with [bFrom, bTo) of b character by
+// character, skipping ignored characters and word breaks
+function diffWordsEqual(a, aFrom, aTo, b, bFrom, bTo) {
+    let aw = aFrom, ak = aw < aTo ? a.starts[aw] : 0;
+    let bw = bFrom, bk = bw < bTo ? b.starts[bw] : 0;
+    for (;;) {
+        let ac = -1;
+        while (aw < aTo) {
+            if (ak >= a.ends[aw]) {
+                if (++aw < aTo) ak = a.starts[aw];
+                continue;
+            }
+            ac = foldDiffChar(a.text.charCodeAt(ak++));
+            if (ac >= 0) break;
+        }
+        let bc = -1;
+        while (bw < bTo) {
+            if (bk >= b.ends[bw]) {
+                if (++bw < bTo) bk = b.starts[bw];
+                continue;
+            }
+            bc = foldDiffChar(b.text.charCodeAt(bk++));
+            if (bc >= 0) break;
+        }
+        if (ac !== bc) return false;
+        if (ac < 0) return true;
+    }
+}
+
+// Highlight results and phrase hashes are reused across re-renders; both maps
+// are LRU-bounded (Map iteration order is insertion order).
+const HIGHLIGHT_CACHE_LIMIT = 200;
+const highlightCache = new Map();
+const phraseHashCache = new Map();
+const wordOpsHighlightCache = new WeakMap();
+
+function lruGet(cache, key) {
+    const value = cache.get(key);
+    if (value !== undefined) {
+        cache.delete(key);
+        cache.set(key, value);
+    }
+    return value;
+}
+
+function lruSet(cache, key, value) {
+    cache.set(key, value);
+    if (cache.size > HIGHLIGHT_CACHE_LIMIT) {
+        cache.delete(cache.keys().next().value);
+    }
+    return value;
+}
+
+function getPhraseHashes(text) {
+    return lruGet(phraseHashCache, text) || lruSet(phraseHashCache, text, buildPhraseHashes(text));
+}
+
+function memoizeHighlight(mode, script, book, wordOps, compute) {
+    if (Array.isArray(wordOps) && wordOps.length > 0) {
+        // Word ops live on the report's sentence objects, so key by identity
+        let entry = wordOpsHighlightCache.get(wordOps);
+        if (!entry) {
+            entry = {};
+            wordOpsHighlightCache.set(wordOps, entry);
+        }
+        return entry[mode] || (entry[mode] = compute(script, book, wordOps));
+    }
+
+    const key = `${mode}\u0000${script}\u0000${book}`;
+    return lruGet(highlightCache, key) || lruSet(highlightCache, key, compute(script, book, null));
+}
+
+function phraseMatches(phrases, start, n, target, targetStart, targetEnd, targetHash) {
+    if (phrases.grams[n - 1][start] !== targetHash) return false;
+    // Hash hit: confirm character by character to rule out collisions
+    return diffWordsEqual(phrases, start, start + n, target, targetStart, targetEnd);
+}
+
 function buildDiffFromWordOps(wordOps, options) {
     if (!Array.isArray(wordOps) || wordOps.length === 0) {
         return null;
@@ -1889,181 +2286,172 @@ function buildDiffFromWordOps(wordOps, options) {
 }
 
 function highlightDifferences(script, book, wordOps = null) {
-    const diffFromOps = buildDiffFromWordOps(wordOps, {
+    return memoizeHighlight('plain', script, book, wordOps, computeHighlightDifferences);
+}
+
+function computeHighlightDifferences(script, book, wordOps) {
+    const options = {
         normal: word => word,
         highlight: word => `[${word}]`
-    });
-
-    if (diffFromOps) {
-        return {
-            scriptHighlighted: diffFromOps.script,
-            bookHighlighted: diffFromOps.book
-        };
-    }
-
-    const scriptWords = script.split(/\s+/);
-    const bookWords = book.split(/\s+/);
-
-    let scriptResult = [];
-    let bookResult = [];
-    let scriptMismatchBuffer = [];
-    let bookMismatchBuffer = [];
-
-    function normalizeWord(word) {
-        return word.replace(/[.,!?;:'"()\-—–]/g, '').toLowerCase();
-    }
-
-    function flushBuffers() {
-        if (scriptMismatchBuffer.length > 0) {
-            scriptResult.push(`[${scriptMismatchBuffer.join(' ')}]`);
-            scriptMismatchBuffer = [];
-        }
-        if (bookMismatchBuffer.length > 0) {
-            bookResult.push(`[${bookMismatchBuffer.join(' ')}]`);
-            bookMismatchBuffer = [];
-        }
-    }
-
-    let i = 0, j = 0;
-
-    while (i < scriptWords.length || j < bookWords.length) {
-        const scriptWord = scriptWords[i] || '';
-        const bookWord = bookWords[j] || '';
-
-        const scriptNorm = normalizeWord(scriptWord);
-        const bookNorm = normalizeWord(bookWord);
+    };
+    const diff = buildDiffFromWordOps(wordOps, options) || alignDiffWords(script, book, options);
+    return {
+        scriptHighlighted: diff.script,
+        bookHighlighted: diff.book
+    };
+}
 
-        if (scriptNorm === bookNorm) {
-            flushBuffers();
-            if (scriptWord) scriptResult.push(scriptWord);
-            if (bookWord) bookResult.push(bookWord);
-            i++;
-            j++;
-        } else {
-            let matched = false;
-            for (let n = 1; n <= 3 && i + n <= scriptWords.length; n++) {
-                const scriptPhrase = scriptWords.slice(i, i + n).join('');
-                const scriptPhraseNorm = normalizeWord(scriptPhrase);
-                if (scriptPhraseNorm === bookNorm) {
-                    flushBuffers();
-                    scriptResult.push(scriptWords.slice(i, i + n).join(' '));
-                    bookResult.push(bookWord);
-                    i += n;
-                    j++;
-                    matched = true;
-                    break;
+function diffSameWord(a, x, b, y) {
+    return a.grams[0][x] === b.grams[0][y] && diffWordsEqual(a, x, x + 1, b, y, y + 1);
+}
+
+// Longest common word subsequence of a and b by Myers' O(ND) greedy diff,
+// after stripping the common prefix and suffix. Returns the matched word
+// pairs as parallel index arrays in increasing order.
+function diffWordMatches(a, b) {
+    const aMatch = [];
+    const bMatch = [];
+    let head = 0;
+    while (head < a.count && head < b.count && diffSameWord(a, head, b, head)) head++;
+    let aTail = a.count, bTail = b.count;
+    while (aTail > head && bTail > head && diffSameWord(a, aTail - 1, b, bTail - 1)) {
+        aTail--;
+        bTail--;
+    }
+    for (let k = 0; k < head; k++) {
+        aMatch.push(k);
+        bMatch.push(k);
+    }
+
+    const n = aTail - head;
+    const m = bTail - head;
+    if (n > 0 && m > 0) {
+        // v[offset + k] is the furthest x reached on diagonal k = x - y; the
+        // slice saved before each round is enough to walk the path back
+        const max = n + m;
+        const offset = max;
+        const v = new Int32Array(2 * max + 2);
+        const trace = [];
+        let found = -1;
+        for (let d = 0; d <= max && found < 0; d++) {
+            trace.push(v.slice(offset - d, offset + d + 1));
+            for (let k = -d; k <= d; k += 2) {
+                let x = k === -d || (k !== d && v[offset + k - 1] < v[offset + k + 1])
+                    ? v[offset + k + 1]
+                    : v[offset + k - 1] + 1;
+                let y = x - k;
+                while (x < n && y < m && diffSameWord(a, head + x, b, head + y)) {
+                    x++;
+                    y++;
                 }
-            }
-
-            if (!matched) {
-                for (let n = 1; n <= 3 && j + n <= bookWords.length; n++) {
-                    const bookPhrase = bookWords.slice(j, j + n).join('');
-                    const bookPhraseNorm = normalizeWord(bookPhrase);
-                    if (bookPhraseNorm === scriptNorm) {
-                        flushBuffers();
-                        scriptResult.push(scriptWord);
-                        bookResult.push(bookWords.slice(j, j + n).join(' '));
-                        i++;
-                        j += n;
-                        matched = true;
-                        break;
-                    }
+                v[offset + k] = x;
+                if (x >= n && y >= m) {
+                    found = d;
+                    break;
                 }
             }
+        }
 
-            if (!matched) {
-                if (scriptWord) scriptMismatchBuffer.push(scriptWord);
-                if (bookWord) bookMismatchBuffer.push(bookWord);
-                if (i < scriptWords.length) i++;
-                if (j < bookWords.length) j++;
+        const middleA = [];
+        const middleB = [];
+        let x = n, y = m;
+        for (let d = found; d > 0; d--) {
+            const prev = trace[d];
+            const k = x - y;
+            const prevK = k === -d || (k !== d && prev[k - 1 + d] < prev[k + 1 + d]) ? k + 1 : k - 1;
+            const prevX = prev[prevK + d];
+            const prevY = prevX - prevK;
+            while (x > prevX && y > prevY) {
+                x--;
+                y--;
+                middleA.push(head + x);
+                middleB.push(head + y);
             }
+            x = prevX;
+            y = prevY;
+        }
+        while (x > 0 && y > 0) {
+            x--;
+            y--;
+            middleA.push(head + x);
+            middleB.push(head + y);
+        }
+        for (let k = middleA.length - 1; k >= 0; k--) {
+            aMatch.push(middleA[k]);
+            bMatch.push(middleB[k]);
         }
     }
 
-    flushBuffers();
-
-    return {
-        scriptHighlighted: scriptResult.join(' '),
-        bookHighlighted: bookResult.join(' ')
-    };
-}
-
-function highlightDifferencesVisual(script, book, wordOps = null) {
-    const diffFromOps = buildDiffFromWordOps(wordOps, {
-        normal: word => escapeHtml(word),
-        highlight: word => `<mark class="diff-highlight">${escapeHtml(word)}</mark>`
-    });
-
-    if (diffFromOps) {
-        return {
-            scriptHighlighted: diffFromOps.script,
-            bookHighlighted: diffFromOps.book
-        };
+    for (let k = 0; k < a.count - aTail; k++) {
+        aMatch.push(aTail + k);
+        bMatch.push(bTail + k);
     }
+    return { aMatch, bMatch };
+}
 
-    const scriptWords = script.split(/\s+/);
-    const bookWords = book.split(/\s+/);
+// Anchor on the longest common word subsequence, then walk each gap between
+// anchors letting up to MAX_PHRASE_WORDS words on one side match a single
+// word on the other; runs of unmatched words are highlighted
+function alignDiffWords(script, book, options) {
+    const scriptPhrases = getPhraseHashes(script);
+    const bookPhrases = getPhraseHashes(book);
+    const { aMatch, bMatch } = diffWordMatches(scriptPhrases, bookPhrases);
 
-    let scriptResult = [];
-    let bookResult = [];
+    const scriptResult = [];
+    const bookResult = [];
     let scriptMismatchBuffer = [];
     let bookMismatchBuffer = [];
 
-    function normalizeWord(word) {
-        return word.replace(/[.,!?;:'"()\-—–]/g, '').toLowerCase();
-    }
-
     function flushBuffers() {
         if (scriptMismatchBuffer.length > 0) {
-            scriptResult.push(`<mark class="diff-highlight">${escapeHtml(scriptMismatchBuffer.join(' '))}</mark>`);
+            scriptResult.push(options.highlight(scriptMismatchBuffer.join(' ')));
             scriptMismatchBuffer = [];
         }
         if (bookMismatchBuffer.length > 0) {
-            bookResult.push(`<mark class="diff-highlight">${escapeHtml(bookMismatchBuffer.join(' '))}</mark>`);
+            bookResult.push(options.highlight(bookMismatchBuffer.join(' ')));
             bookMismatchBuffer = [];
         }
     }
 
-    let i = 0, j = 0;
+    const emptyHash = FNV_OFFSET >>> 0;
 
-    while (i < scriptWords.length || j < bookWords.length) {
-        const scriptWord = scriptWords[i] || '';
-        const bookWord = bookWords[j] || '';
+    function alignGap(i, scriptCount, j, bookCount) {
+        while (i < scriptCount || j < bookCount) {
+            // Past the end of one side, compare against an empty word
+            const scriptEnd = i < scriptCount ? i + 1 : i;
+            const bookEnd = j < bookCount ? j + 1 : j;
 
-        const scriptNorm = normalizeWord(scriptWord);
-        const bookNorm = normalizeWord(bookWord);
+            if (diffWordsEqual(scriptPhrases, i, scriptEnd, bookPhrases, j, bookEnd)) {
+                flushBuffers();
+                if (scriptEnd > i) scriptResult.push(options.normal(diffWord(scriptPhrases, i)));
+                if (bookEnd > j) bookResult.push(options.normal(diffWord(bookPhrases, j)));
+                i = scriptEnd;
+                j = bookEnd;
+                continue;
+            }
 
-        if (scriptNorm === bookNorm) {
-            flushBuffers();
-            if (scriptWord) scriptResult.push(escapeHtml(scriptWord));
-            if (bookWord) bookResult.push(escapeHtml(bookWord));
-            i++;
-            j++;
-        } else {
             let matched = false;
-            for (let n = 1; n <= 3 && i + n <= scriptWords.length; n++) {
-                const scriptPhrase = scriptWords.slice(i, i + n).join('');
-                const scriptPhraseNorm = normalizeWord(scriptPhrase);
-                if (scriptPhraseNorm === bookNorm) {
+            const bookHash = bookEnd > j ? bookPhrases.grams[0][j] : emptyHash;
+            for (let n = 1; n <= MAX_PHRASE_WORDS && i + n <= scriptCount; n++) {
+                if (phraseMatches(scriptPhrases, i, n, bookPhrases, j, bookEnd, bookHash)) {
                     flushBuffers();
-                    scriptResult.push(escapeHtml(scriptWords.slice(i, i + n).join(' ')));
-                    bookResult.push(escapeHtml(bookWord));
+                    scriptResult.push(options.normal(diffPhrase(scriptPhrases, i, i + n)));
+                    if (bookEnd > j) bookResult.push(options.normal(diffWord(bookPhrases, j)));
                     i += n;
-                    j++;
+                    j = bookEnd;
                     matched = true;
                     break;
                 }
             }
 
             if (!matched) {
-                for (let n = 1; n <= 3 && j + n <= bookWords.length; n++) {
-                    const bookPhrase = bookWords.slice(j, j + n).join('');
-                    const bookPhraseNorm = normalizeWord(bookPhrase);
-                    if (bookPhraseNorm === scriptNorm) {
+                const scriptHash = scriptEnd > i ? scriptPhrases.grams[0][i] : emptyHash;
+                for (let n = 1; n <= MAX_PHRASE_WORDS && j + n <= bookCount; n++) {
+                    if (phraseMatches(bookPhrases, j, n, scriptPhrases, i, scriptEnd, scriptHash)) {
                         flushBuffers();
-                        scriptResult.push(escapeHtml(scriptWord));
-                        bookResult.push(escapeHtml(bookWords.slice(j, j + n).join(' ')));
-                        i++;
+                        if (scriptEnd > i) scriptResult.push(options.normal(diffWord(scriptPhrases, i)));
+                        bookResult.push(options.normal(diffPhrase(bookPhrases, j, j + n)));
+                        i = scriptEnd;
                         j += n;
                         matched = true;
                         break;
@@ -2072,19 +2460,45 @@ function highlightDifferencesVisual(script, book, wordOps = null) {
             }
 
             if (!matched) {
-                if (scriptWord) scriptMismatchBuffer.push(scriptWord);
-                if (bookWord) bookMismatchBuffer.push(bookWord);
-                if (i < scriptWords.length) i++;
-                if (j < bookWords.length) j++;
+                if (scriptEnd > i) scriptMismatchBuffer.push(diffWord(scriptPhrases, i));
+                if (bookEnd > j) bookMismatchBuffer.push(diffWord(bookPhrases, j));
+                i = scriptEnd;
+                j = bookEnd;
             }
         }
     }
 
+    let i = 0, j = 0;
+    for (let k = 0; k < aMatch.length; k++) {
+        alignGap(i, aMatch[k], j, bMatch[k]);
+        flushBuffers();
+        scriptResult.push(options.normal(diffWord(scriptPhrases, aMatch[k])));
+        bookResult.push(options.normal(diffWord(bookPhrases, bMatch[k])));
+        i = aMatch[k] + 1;
+        j = bMatch[k] + 1;
+    }
+    alignGap(i, scriptPhrases.count, j, bookPhrases.count);
     flushBuffers();
 
     return {
-        scriptHighlighted: scriptResult.join(' '),
-        bookHighlighted: bookResult.join(' ')
+        script: scriptResult.join(' '),
+        book: bookResult.join(' ')
+    };
+}
+
+function highlightDifferencesVisual(script, book, wordOps = null) {
+    return memoizeHighlight('visual', script, book, wordOps, computeHighlightDifferencesVisual);
+}
+
+function computeHighlightDifferencesVisual(script, book, wordOps) {
+    const options = {
+        normal: word => escapeHtml(word),
+        highlight: word => `<mark class="diff-highlight">${escapeHtml(word)}</mark>`
+    };
+    const diff = buildDiffFromWordOps(wordOps, options) || alignDiffWords(script, book, options);
+    return {
+        scriptHighlighted: diff.script,
+        bookHighlighted: diff.book
     };
 }
 
@@ -2265,6 +2679,7 @@ function createMobileHeader() {
     dropdown.className = 'mobile-chapters-dropdown';
     dropdown.id = 'mobile-chapters-dropdown';
     document.body.insertBefore(dropdown, document.getElementById('sidebar'));
+    setupClickActions(dropdown);
 }
 
 function toggleMobileChapters() {
@@ -2284,8 +2699,8 @@ function toggleMobileChapters() {
             const reviewedClass = isReviewed ? 'reviewed' : '';
             return `
                 <div class="chapter-item ${chapter.name === currentChapter ? 'active' : ''} ${reviewedClass}"
-                     onclick="loadReport('${chapter.name}'); toggleMobileChapters();">
-                    <div class="chapter-name">${chapter.name}</div>
+                     data-action="open-chapter-menu" data-chapter="${escapeHtml(chapter.name)}">
+                    <div class="chapter-name">${escapeHtml(chapter.name)}</div>
                     <div class="chapter-stats">Flagged: ${chapter.metrics.sentenceFlagged} sentences</div>
                 </div>
             `;
@@ -2571,6 +2986,8 @@ function setupMobileHeaderAutoHide() {
 }
 
 // Initialize on page load
+setupClickActions(document.getElementById('content'));
+setupClickActions(document.getElementById('chapter-list'));
 loadChapters().then(() => {
     loadOverview();
     createMobileHeader();